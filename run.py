@@ -10,26 +10,35 @@ This script consolidates all execution modes into a single parameterized interfa
 """
 
 import multiprocessing as mp
+from multiprocessing.connection import Connection, wait
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
 import os
+import sys
 import csv
+import math
 import argparse
 import time
+import traceback
 from pathlib import Path
+from statistics import fmean
 from typing import List, Tuple, Dict, Optional, Union, Any
 
-from src.shared.blackboard import GlobalBest
+from src.shared.blackboard import SharedGlobalBest
 from src.main import initialize_agent, run_cycle, AGENTS
 from src.utils.logger import get_logger, set_instance_name
 from src.agent_beliefs import AgentBeliefs
 from src.utils.generate_random_feasible_route import generate_random_feasible_route
 from src.utils.evaluator import evaluate_route
 from src.utils.load_instance import load_instance
+from src.actions.vnd.vnd import VND_STRATEGIES, set_default_strategy as set_vnd_strategy
 
 # Default configuration
 DEFAULT_NUM_AGENTS = 5
 DEFAULT_MAX_EVALUATIONS = 20000  # Default evaluation budget
 DEFAULT_ACTIONS = "mahm"
 NUM_RUNS = 20  # Number of repetitions for each action scenario
+LOG_FLUSH_INTERVAL = 100  # Agent log is written to disk every this many iterations
 
 # Available metaheuristics
 AVAILABLE_METAHEURISTICS = ["VND", "ILS", "VNS"]
@@ -120,17 +129,15 @@ def get_instance_files(instances_dir: str = "instances", instance_name: Optional
     return instance_files
 
 
-def initialize_agent_with_metaheuristics(agent_id: str, instance_path: str, metaheuristics: List[str]):
+def initialize_agent_with_metaheuristics(agent_id: str, instance: dict, metaheuristics: List[str]):
     """
     Initialize agent with specific metaheuristics.
     
     Args:
         agent_id: Agent identifier
-        instance_path: Path to the instance file
+        instance: Instance data (as returned by load_instance), shared by the agents of a process
         metaheuristics: List of metaheuristic names to use
     """
-    instance = load_instance(instance_path)
-    
     # Generate initial feasible route with validation
     max_attempts = 100
     initial_route = None
@@ -168,32 +175,113 @@ def initialize_agent_with_metaheuristics(agent_id: str, instance_path: str, meta
     }
 
 
-def agent_worker(agent_id: str, max_evaluations: int, num_agents: int, global_blackboard: GlobalBest, 
-                 instance_path: str, instance_name: str, metaheuristics: List[str], action_name: str,
-                 agent_times: Dict[str, float], agent_counters: Dict[str, int], run_number: int):
+# Per-process state of the agent processes, set once by init_agent_process
+_worker_blackboard: Optional[SharedGlobalBest] = None
+_worker_instance: Optional[dict] = None
+_worker_agent_counters: Optional[Dict[str, int]] = None
+
+
+def init_agent_process(global_blackboard: SharedGlobalBest, instance: dict):
+    """
+    Initializer of an agent process (called by run_agent_process).
+    
+    With the "fork" context the arguments are inherited from the parent
+    (the instance is parsed once and shared copy-on-write); with "spawn"
+    they are sent once per process.
+    
+    Args:
+        global_blackboard: Shared g_best (SharedGlobalBest attached to the shared memory block)
+        instance: Instance data (as returned by load_instance)
+    """
+    global _worker_blackboard, _worker_instance, _worker_agent_counters
+    _worker_blackboard = global_blackboard
+    _worker_instance = instance
+    # Evaluation counts are only updated by the agent of this process, so they
+    # are kept in a plain local dict; agent_worker returns its final count
+    agent_counters = {}
+    _worker_agent_counters = agent_counters
+    
+    # Inject the shared blackboard into the module
+    import src.shared.blackboard
+    src.shared.blackboard.global_best = global_blackboard
+    
+    # Set the agent_counters in compute_route_cost module for this process
+    from src.utils.compute_route_cost import set_agent_counters
+    set_agent_counters(agent_counters)
+
+
+def run_agent_process(connection: Connection, global_blackboard: SharedGlobalBest, instance: dict,
+                      worker_args: tuple):
+    """
+    Entry point of an agent process: runs agent_worker and sends
+    ("ok", result) or ("error", (exception, traceback text)) to the parent.
+    
+    Args:
+        connection: Write end of the pipe to the parent
+        global_blackboard: Shared g_best (see init_agent_process)
+        instance: Instance data (see init_agent_process)
+        worker_args: Arguments of agent_worker
+    """
+    try:
+        init_agent_process(global_blackboard, instance)
+        result = ("ok", agent_worker(*worker_args))
+    except Exception as e:
+        remote_traceback = traceback.format_exc()
+        try:
+            connection.send(("error", (e, remote_traceback)))
+        except Exception:
+            # The exception itself could not be pickled
+            connection.send(("error", (RuntimeError(f"{type(e).__name__}: {e}"), remote_traceback)))
+    else:
+        connection.send(result)
+    finally:
+        connection.close()
+
+
+def pin_to_cpu(agent_index: int) -> Optional[int]:
+    """
+    Pin the calling process to a single CPU, chosen round-robin by agent index
+    among the CPUs the process is allowed to run on.
+    
+    Args:
+        agent_index: Ordinal of the agent (0 for agent_0, ...)
+    
+    Returns:
+        The CPU the process was pinned to, or None where CPU affinity is not supported
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return None
+    cpus = sorted(os.sched_getaffinity(0))
+    cpu = cpus[agent_index % len(cpus)]
+    os.sched_setaffinity(0, {cpu})
+    return cpu
+
+
+def agent_worker(agent_id: str, max_evaluations: int, num_agents: int, instance_name: str,
+                 metaheuristics: List[str], action_name: str, run_number: int,
+                 cpu_index: Optional[int] = None, vnd_strategy: str = "best") -> Tuple[float, int]:
     """
-    Worker function for each agent process.
+    Runs one agent inside its agent process (see run_agent_process).
     
     Args:
         agent_id: Agent ID
         max_evaluations: Maximum number of objective function evaluations (total across all agents)
         num_agents: Number of agents in the experiment
-        global_blackboard: Shared GlobalBest instance
-        instance_path: Path to the instance file
         instance_name: Name of the instance (for logging)
         metaheuristics: List of metaheuristics to use (restricts agent to only these)
         action_name: Name of the action (e.g., 'mahm', 'ils', 'vnd', 'vns') for logging directory
-        agent_times: Shared dictionary to store execution times for each agent
-        agent_counters: Shared dictionary to store evaluation counts for each agent
         run_number: Current run number (1-20)
+        cpu_index: If given, pin this worker to a dedicated CPU (see pin_to_cpu) before running
+        vnd_strategy: VND strategy ("best", "first" or "auto") used by every metaheuristic of the agent
+    
+    Returns:
+        (execution time of the agent in seconds, number of objective function evaluations)
     """
-    # Inject the shared blackboard into the module
-    import src.shared.blackboard
-    src.shared.blackboard.global_best = global_blackboard
+    global_blackboard = _worker_blackboard
+    agent_counters = _worker_agent_counters
     
-    # Set the agent_counters in compute_route_cost module for this process
-    from src.utils.compute_route_cost import set_agent_counters
-    set_agent_counters(agent_counters)
+    pinned_cpu = pin_to_cpu(cpu_index) if cpu_index is not None else None
+    set_vnd_strategy(vnd_strategy)
     
     # Set agent context for evaluation counting (must be set before any evaluations)
     from src.utils.evaluation_counter import set_agent_context
@@ -205,93 +293,115 @@ def agent_worker(agent_id: str, max_evaluations: int, num_agents: int, global_bl
     # Initialize logger for this agent
     logger = get_logger(agent_id, instance_name, action_name, run_number)
     
-    # Start timing
-    start_time = time.time()
-    
-    logger.log("===================================")
-    logger.log(" STARTING AGENT EXECUTION ")
-    logger.log("===================================")
-    logger.log(f"Instance: {instance_name}")
-    
-    # Initialize the agent with the specified instance and metaheuristics
-    initialize_agent_with_metaheuristics(agent_id, instance_path, metaheuristics)
-    
-    # Verify that the agent was initialized with the correct metaheuristics
-    agent_beliefs = AGENTS[agent_id]["beliefs"]
-    available_actions = list(agent_beliefs.actions.keys())
-    if set(available_actions) != set(metaheuristics):
-        raise ValueError(
-            f"[ERROR] Agent {agent_id} was not initialized correctly. "
-            f"Expected: {metaheuristics}, Got: {available_actions}"
-        )
-    
-    logger.log(f"Available Metaheuristics: {available_actions}")
-    
-    beliefs = AGENTS[agent_id]["beliefs"]
-    
-    # Calculate per-agent evaluation budget
-    agent_budget = max_evaluations // num_agents
-    beliefs.set_evaluation_budget(agent_budget)
-    
-    logger.log("\n--- Initial state ---")
-    logger.log(f"Initial Solution/Route: {beliefs.current_route}")
-    logger.log(f"Initial Cost: {beliefs.current_cost}")
-    logger.log(f"Evaluation Budget: {agent_budget}")
-    logger.log("----------------------\n")
-    
-    # Sync evaluation count from shared counter (accounts for initialization evaluations)
-    initial_count = agent_counters.get(agent_id, 0)
-    beliefs.update_evaluation_count(initial_count)
-    
-    # Execute the agent cycle with evaluation budget stopping criterion
-    iteration = 0
-    while beliefs.has_budget_remaining():
-        logger.log(f"\n==== ITERATION {iteration} ====")
+    # Buffered log lines must reach the file even if the agent fails: an agent
+    # process exits without running atexit handlers
+    try:
+        # Start timing
+        start_time = time.time()
+        
+        logger.log("===================================")
+        logger.log(" STARTING AGENT EXECUTION ")
+        logger.log("===================================")
+        logger.log(f"Instance: {instance_name}")
+        if pinned_cpu is not None:
+            logger.log(f"Pinned to CPU: {pinned_cpu}")
+        logger.log(f"VND Strategy: {vnd_strategy}")
+        
+        # Initialize the agent with the specified instance and metaheuristics
+        initialize_agent_with_metaheuristics(agent_id, _worker_instance, metaheuristics)
+        
+        # Verify that the agent was initialized with the correct metaheuristics
+        agent_beliefs = AGENTS[agent_id]["beliefs"]
+        available_actions = list(agent_beliefs.actions.keys())
+        if set(available_actions) != set(metaheuristics):
+            raise ValueError(
+                f"[ERROR] Agent {agent_id} was not initialized correctly. "
+                f"Expected: {metaheuristics}, Got: {available_actions}"
+            )
+        
+        logger.log(f"Available Metaheuristics: {available_actions}")
+        
+        beliefs = AGENTS[agent_id]["beliefs"]
+        
+        # Calculate per-agent evaluation budget
+        agent_budget = max_evaluations // num_agents
+        beliefs.set_evaluation_budget(agent_budget)
+        
+        logger.log("\n--- Initial state ---")
+        logger.log(f"Initial Solution/Route: {beliefs.current_route}")
+        logger.log(f"Initial Cost: {beliefs.current_cost}")
+        logger.log(f"Evaluation Budget: {agent_budget}")
+        logger.log("----------------------\n")
+        
+        # Sync evaluation count from shared counter (accounts for initialization evaluations)
+        initial_count = agent_counters.get(agent_id, 0)
+        beliefs.update_evaluation_count(initial_count)
+        
+        # Execute the agent cycle with evaluation budget stopping criterion
+        iteration = 0
+        log_enabled = logger.is_enabled()
+        log, log_state = logger.log, logger.log_state  # bound once for the loop
+        g_cost, g_agent = None, None  # g_best snapshot for the state log
+        g_version = 0  # blackboard version the snapshot was taken at (0 = never updated)
+        while beliefs.has_budget_remaining():
+            if log_enabled:
+                log(f"\n==== ITERATION {iteration} ====")
+        
+            run_cycle(agent_id)
+        
+            # Update evaluation count from shared counter
+            current_count = agent_counters.get(agent_id, 0)
+            beliefs.update_evaluation_count(current_count)
+        
+            # Refresh the g_best snapshot only when the blackboard changed
+            version = global_blackboard.get_version()
+            if version != g_version:
+                g_version = version
+                g_route, g_cost, g_agent = global_blackboard.get()
+                if g_route is None:
+                    g_cost, g_agent = None, None
+        
+            if log_enabled:
+                log_state(
+                    current_cost=beliefs.current_cost,
+                    p_best_cost=beliefs.p_best_cost,
+                    g_best_cost=g_cost,
+                    g_best_agent=g_agent
+                )
         
-        run_cycle(agent_id)
+            iteration += 1
+            if iteration % LOG_FLUSH_INTERVAL == 0:
+                logger.flush()
         
-        # Update evaluation count from shared counter
-        current_count = agent_counters.get(agent_id, 0)
-        beliefs.update_evaluation_count(current_count)
+            # Check budget again after updating count
+            if not beliefs.has_budget_remaining():
+                break
+        
+        logger.log("\n===================================")
+        logger.log(" EXECUTION FINALIZED ")
+        logger.log("===================================")
+        
+        logger.log("\n--- Final result ---")
+        logger.log(f"Agent's p_best cost: {beliefs.p_best_cost}")
+        logger.log(f"Agent's p_best solution/route: {beliefs.p_best_route}")
         
         g_route, g_cost, g_agent = global_blackboard.get()
-        logger.log_state(
-            current_cost=beliefs.current_cost,
-            p_best_cost=beliefs.p_best_cost,
-            g_best_cost=g_cost if g_route is not None else None,
-            g_best_agent=g_agent if g_route is not None else None
-        )
+        logger.log(f"\nGlobal Best:")
+        logger.log(f"Cost : {g_cost}")
+        logger.log(f"Solution/Route  : {g_route}")
         
-        iteration += 1
+        # Calculate and log execution time
+        end_time = time.time()
+        elapsed_time = end_time - start_time
+        logger.log(f"\nRun Time: {elapsed_time:.2f} seconds ({elapsed_time/60:.2f} minutes)")
         
-        # Check budget again after updating count
-        if not beliefs.has_budget_remaining():
-            break
-    
-    logger.log("\n===================================")
-    logger.log(" EXECUTION FINALIZED ")
-    logger.log("===================================")
-    
-    logger.log("\n--- Final result ---")
-    logger.log(f"Agent's p_best cost: {beliefs.p_best_cost}")
-    logger.log(f"Agent's p_best solution/route: {beliefs.p_best_route}")
-    
-    g_route, g_cost, g_agent = global_blackboard.get()
-    logger.log(f"\nGlobal Best:")
-    logger.log(f"Cost : {g_cost}")
-    logger.log(f"Solution/Route  : {g_route}")
-    
-    # Calculate and log execution time
-    end_time = time.time()
-    elapsed_time = end_time - start_time
-    logger.log(f"\nRun Time: {elapsed_time:.2f} seconds ({elapsed_time/60:.2f} minutes)")
-    
-    # Get final evaluation count and log it
-    final_evaluation_count = agent_counters.get(agent_id, 0)
-    logger.log(f"Total Evaluations: {final_evaluation_count}")
-    
-    # Store execution time in shared dictionary
-    agent_times[agent_id] = elapsed_time
+        # Get final evaluation count and log it
+        final_evaluation_count = agent_counters.get(agent_id, 0)
+        logger.log(f"Total Evaluations: {final_evaluation_count}")
+        
+        return elapsed_time, final_evaluation_count
+    finally:
+        logger.close()
 
 
 def write_outcome_log(instance_name: str, action_name: str, num_agents: int, 
@@ -505,8 +615,20 @@ def write_summary_log(instance_name: str, action_name: str, num_agents: int, num
         f.write("\n" + "=" * 80 + "\n")
 
 
+def default_mp_context() -> BaseContext:
+    """
+    Multiprocessing context for the agent processes: "fork" on Linux, so they
+    inherit the parsed instance and loaded modules copy-on-write instead of
+    re-importing everything; "spawn" elsewhere (fork is unavailable on
+    Windows and unsafe on macOS).
+    """
+    return mp.get_context("fork" if sys.platform.startswith("linux") else "spawn")
+
+
 def run_experiment_for_instance(instance_path: str, instance_name: str, metaheuristics: List[str], 
-                                num_agents: int, max_evaluations: int, run_number: int) -> Optional[float]:
+                                num_agents: int, max_evaluations: int, run_number: int,
+                                mp_context: Optional[BaseContext] = None,
+                                pin_cpus: bool = False, vnd_strategy: str = "best") -> Optional[float]:
     """
     Run experiment for a specific instance and metaheuristic configuration.
     
@@ -517,37 +639,77 @@ def run_experiment_for_instance(instance_path: str, instance_name: str, metaheur
         num_agents: Number of agents to run
         max_evaluations: Maximum number of objective function evaluations (total across all agents)
         run_number: Current run number (1-20)
+        mp_context: Multiprocessing context used for the agent processes and the g_best lock
+                    (default: default_mp_context()). Passed explicitly so the global start
+                    method is never reconfigured.
+        pin_cpus: Pin each agent process to its own CPU (Linux only; ignored elsewhere)
+        vnd_strategy: VND strategy of the agents: "best" (default), "first" or "auto"
     
     Returns:
         g_best_cost: Best cost found, or None if no solution found
     """
-    mp.set_start_method("spawn", force=True)
-    
-    manager = mp.Manager()
-    global_blackboard = GlobalBest(manager)
-    agent_times = manager.dict()  # Shared dictionary for agent execution times
-    agent_counters = manager.dict()  # Shared dictionary for agent evaluation counts
+    if mp_context is None:
+        mp_context = default_mp_context()
     
     # Determine action name for logging directory
     action_name = get_action_name(metaheuristics)
     
-    processes = []
-    
-    # Create and start processes for each agent
-    for i in range(num_agents):
-        p = mp.Process(
-            target=agent_worker,
-            args=(f"agent_{i}", max_evaluations, num_agents, global_blackboard, instance_path, instance_name, metaheuristics, action_name, agent_times, agent_counters, run_number)
-        )
-        p.start()
-        processes.append(p)
+    # The instance is parsed once here and handed to every agent process
+    instance = load_instance(instance_path)
     
-    # Wait for all processes to finish
-    for p in processes:
-        p.join()
+    # g_best lives in shared memory sized for this instance's routes (all nodes + return to the depot)
+    route_capacity = len(instance["nodes"]) + 1
+    global_blackboard = SharedGlobalBest(route_capacity, lock=mp_context.Lock())
     
-    # Get final result
-    g_route, g_cost, g_agent = global_blackboard.get()
+    processes: Dict[str, BaseProcess] = {}
+    try:
+        # One process per agent, each reporting its result through its own pipe
+        connections: Dict[Connection, str] = {}
+        for i in range(num_agents):
+            agent_id = f"agent_{i}"
+            reader, writer = mp_context.Pipe(duplex=False)
+            process = mp_context.Process(
+                target=run_agent_process,
+                args=(writer, global_blackboard, instance,
+                      (agent_id, max_evaluations, num_agents, instance_name, metaheuristics, action_name, run_number,
+                       i if pin_cpus else None, vnd_strategy)),
+                name=agent_id
+            )
+            process.start()
+            writer.close()  # the reader sees EOF if the agent process dies without a result
+            processes[agent_id] = process
+            connections[reader] = agent_id
+        
+        # Wait for all agents to finish (re-raises an agent's exception)
+        results = {}
+        while connections:
+            for reader in wait(list(connections)):
+                agent_id = connections.pop(reader)
+                try:
+                    status, payload = reader.recv()
+                except EOFError:
+                    processes[agent_id].join()
+                    raise RuntimeError(
+                        f"[ERROR] Agent {agent_id} exited without a result "
+                        f"(exit code {processes[agent_id].exitcode})"
+                    )
+                finally:
+                    reader.close()
+                if status == "error":
+                    error, remote_traceback = payload
+                    raise error from RuntimeError(remote_traceback)
+                results[agent_id] = payload
+        agent_times = {agent_id: elapsed for agent_id, (elapsed, _) in results.items()}
+        agent_counters = {agent_id: evaluations for agent_id, (_, evaluations) in results.items()}
+        
+        # Get final result (copied out before the shared block is released)
+        g_route, g_cost, g_agent = global_blackboard.get()
+    finally:
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        global_blackboard.close()
     
     # Calculate execution time metrics
     # Since agents run in parallel, the run time is the average time per agent
@@ -569,10 +731,63 @@ def run_experiment_for_instance(instance_path: str, instance_name: str, metaheur
     return g_cost if g_route is not None else None
 
 
-def read_existing_csv(csv_filename: str) -> Dict[str, Dict[str, str]]:
+# Columns kept as text in the results CSV; every other column holds a cost
+TEXT_COLUMNS = ('Instance', '# vertices')
+
+
+def parse_csv_cell(column: str, value: str) -> Union[float, str]:
+    """
+    Convert a raw CSV cell to its in-memory representation.
+    
+    Args:
+        column: Column name of the cell
+        value: Raw cell text
+    
+    Returns:
+        The cost as float for metaheuristic columns, otherwise the text unchanged ("N/A" included)
+    """
+    if column in TEXT_COLUMNS or value == "N/A":
+        return value
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return value
+
+
+def format_csv_cell(value: Union[float, str]) -> str:
+    """Format an in-memory cell back to its CSV text (costs with 2 decimals)"""
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return value
+
+
+def format_summary_field(column: str, value: Union[float, str]) -> str:
+    """
+    Pad a single field of the results summary table printed at the end of main().
+    
+    Args:
+        column: Column name ('Instance', '# vertices' or a metaheuristic column)
+        value: Cell value (costs were already parsed to float by read_existing_csv)
+    
+    Returns:
+        The field padded to its column width
+    """
+    if column == 'Instance':
+        return f"{value:<12}"
+    if column == '# vertices':
+        return f"{value:>12}"
+    if isinstance(value, float):
+        return f"{value:>15.2f}"
+    return f"{value:>15}"
+
+
+def read_existing_csv(csv_filename: str) -> Dict[str, Dict[str, Union[float, str]]]:
     """
     Read existing CSV file if it exists.
     
+    Cost columns are converted to float once here, so consumers never need to
+    re-parse them.
+    
     Args:
         csv_filename: Path to CSV file
     
@@ -585,7 +800,9 @@ def read_existing_csv(csv_filename: str) -> Dict[str, Dict[str, str]]:
             reader = csv.DictReader(csvfile)
             for row in reader:
                 instance_name = row['Instance']
-                existing_data[instance_name] = {k: v for k, v in row.items() if k != 'Instance'}
+                existing_data[instance_name] = {
+                    k: parse_csv_cell(k, v) for k, v in row.items() if k != 'Instance'
+                }
     return existing_data
 
 
@@ -619,12 +836,15 @@ def write_adaptive_csv(results: Dict[str, Dict[str, Union[Optional[float], int,
         if instance_name not in existing_data:
             existing_data[instance_name] = {}
         
-        # Update the column for this execution
-        cost = instance_results.get(column_name)
-        if cost is not None:
-            existing_data[instance_name][column_name] = f"{cost:.2f}"
-        else:
-            existing_data[instance_name][column_name] = "N/A"
+        # Update every cost column produced by this execution (main() may run
+        # several actions in one invocation); fall back to the derived column
+        cost_columns = [c for c in instance_results if c != "# vertices"] or [column_name]
+        for col in cost_columns:
+            cost = instance_results.get(col)
+            if cost is not None:
+                existing_data[instance_name][col] = float(cost)
+            else:
+                existing_data[instance_name][col] = "N/A"
         
         # Update "# vertices" column
         num_vertices = instance_results.get("# vertices")
@@ -648,7 +868,7 @@ def write_adaptive_csv(results: Dict[str, Dict[str, Union[Optional[float], int,
         sorted_instances = sorted(existing_data.keys(), key=lambda x: int(x) if x.isdigit() else 0)
         for instance_name in sorted_instances:
             row = {'Instance': instance_name}
-            row.update(existing_data[instance_name])
+            row.update({k: format_csv_cell(v) for k, v in existing_data[instance_name].items()})
             # Fill missing columns with "N/A"
             for col in sorted_columns:
                 if col != 'Instance' and col not in row:
@@ -674,6 +894,9 @@ Examples:
   
   # Run specific instance with VND, 4 agents, 10000 evaluations
   python run.py --instance 50 --actions vnd --n-agents 4 --max-evaluations 10000
+  
+  # Re-run pairs already present in results.csv
+  python run.py --force
         """
     )
     
@@ -705,6 +928,25 @@ Examples:
         help="Metaheuristic selection: 'mahm', 'ils', 'vnd', or 'vns'. If not provided, runs all 4 actions with 20 repetitions each."
     )
     
+    parser.add_argument(
+        "--pin-cpus",
+        action="store_true",
+        help="Pin each agent process to its own CPU core (Linux only)"
+    )
+    
+    parser.add_argument(
+        "--vnd-strategy",
+        choices=VND_STRATEGIES,
+        default="best",
+        help="VND improvement strategy: 'best', 'first', or 'auto' (first-improvement for long routes) (default: best)"
+    )
+    
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-run (instance, action) pairs that already have a cost in the results CSV"
+    )
+    
     args = parser.parse_args()
     
     # Get instance files
@@ -736,14 +978,25 @@ Examples:
     print("=" * 80)
     print(f"Number of agents: {args.n_agents}")
     print(f"Max evaluations (total): {args.max_evaluations}")
+    print(f"VND strategy: {args.vnd_strategy}")
     print(f"Actions to run: {actions_to_run}")
     print(f"Runs per action: {NUM_RUNS}")
     print(f"Instances to process: {len(instance_files)}")
     if args.instance:
         print(f"Specific instance: {args.instance}")
+    if args.force:
+        print("Force: re-running pairs already present in the results CSV")
     print("=" * 80)
     print()
     
+    csv_filename = "results.csv"
+    
+    # The context is passed down instead of calling mp.set_start_method for every run
+    mp_context = default_mp_context()
+    
+    # Costs computed by previous invocations; those (instance, action) pairs are skipped
+    previous_results = {} if args.force else read_existing_csv(csv_filename)
+    
     # Results dictionary: {instance_name: {action_name: average_cost, "# vertices": num_nodes}}
     results = {}
     
@@ -785,19 +1038,28 @@ Examples:
                         "# vertices": "N/A"
                     }
             
+            # Skip pairs that already have a valid cost from a previous invocation
+            previous_cost = previous_results.get(instance_name, {}).get(column_name)
+            if isinstance(previous_cost, float) and math.isfinite(previous_cost):
+                results[instance_name][column_name] = previous_cost
+                print(f"  Skipped: cost {previous_cost:.2f} already in {csv_filename} (use --force to re-run)")
+                continue
+            
             # Run 20 times for this instance/action combination
-            g_best_costs = []
+            # (preallocated, one slot per run; None marks a failed run)
+            g_best_costs: List[Optional[float]] = [None] * NUM_RUNS
             
             for run_num in range(1, NUM_RUNS + 1):
                 print(f"  Run {run_num}/{NUM_RUNS}...", end=" ", flush=True)
                 
                 try:
                     g_cost = run_experiment_for_instance(
-                        instance_path, instance_name, metaheuristics, args.n_agents, args.max_evaluations, run_num
+                        instance_path, instance_name, metaheuristics, args.n_agents, args.max_evaluations, run_num,
+                        mp_context=mp_context, pin_cpus=args.pin_cpus, vnd_strategy=args.vnd_strategy
                     )
                     
                     if g_cost is not None:
-                        g_best_costs.append(g_cost)
+                        g_best_costs[run_num - 1] = g_cost
                         print(f"✓ Cost: {g_cost:.2f}")
                     else:
                         print(f"❌ No solution")
@@ -808,10 +1070,11 @@ Examples:
                     traceback.print_exc()
             
             # Calculate average cost for this instance/action
-            if g_best_costs:
-                avg_cost = sum(g_best_costs) / len(g_best_costs)
+            valid_costs = [c for c in g_best_costs if c is not None]
+            if valid_costs:
+                avg_cost = fmean(valid_costs)
                 results[instance_name][column_name] = avg_cost
-                print(f"  Average cost: {avg_cost:.2f} (from {len(g_best_costs)}/{NUM_RUNS} successful runs)")
+                print(f"  Average cost: {avg_cost:.2f} (from {len(valid_costs)}/{NUM_RUNS} successful runs)")
             else:
                 results[instance_name][column_name] = None
                 print(f"  Average cost: N/A (no successful runs)")
@@ -824,7 +1087,6 @@ Examples:
     print(" GENERATING RESULTS TABLE")
     print("=" * 80)
     
-    csv_filename = "results.csv"
     # Collect all executed metaheuristics (all available for CSV column determination)
     write_adaptive_csv(results, csv_filename, AVAILABLE_METAHEURISTICS)
     
@@ -846,36 +1108,17 @@ Examples:
         sorted_columns = ['Instance', '# vertices'] + sorted([c for c in all_columns if c not in ['Instance', '# vertices']])
         
         # Print header
-        for col in sorted_columns:
-            if col == 'Instance':
-                print(f"{col:<12}", end="")
-            elif col == '# vertices':
-                print(f"{col:>12}", end="")
-            else:
-                print(f"{col:>15}", end="")
-        print()
+        print("".join(format_summary_field(col, col) for col in sorted_columns))
         print("-" * 80)
         
-        # Print rows
+        # Print rows (one write per row)
         sorted_instances = sorted(existing_data.keys(), key=lambda x: int(x) if x.isdigit() else 0)
         for instance_name in sorted_instances:
             instance_data = existing_data[instance_name]
-            for col in sorted_columns:
-                if col == 'Instance':
-                    print(f"{instance_name:<12}", end="")
-                elif col == '# vertices':
-                    value = instance_data.get(col, "N/A")
-                    print(f"{value:>12}", end="")
-                else:
-                    value = instance_data.get(col, "N/A")
-                    if value != "N/A":
-                        try:
-                            print(f"{float(value):>15.2f}", end="")
-                        except (ValueError, TypeError):
-                            print(f"{value:>15}", end="")
-                    else:
-                        print(f"{'N/A':>15}", end="")
-            print()
+            print("".join(
+                format_summary_field(col, instance_name if col == 'Instance' else instance_data.get(col, "N/A"))
+                for col in sorted_columns
+            ))
     
     print("\n" + "=" * 80)
     print(" EXPERIMENTO CONCLUÍDO")
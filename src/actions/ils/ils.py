@@ -19,16 +19,20 @@ def ils(
     best_route = current_route
     best_cost = current_cost
 
+    # Perturbed routes are written into one reusable buffer: vnd copies its
+    # initial route, so the buffer is never kept past an iteration
+    perturbed_route = current_route.copy()
+
     for it in range(max_iterations):
 
 
-        perturbed_route = perturb_route(current_route, k=2)
+        perturb_route(current_route, k=2, out=perturbed_route)
 
-        feasible, _ = evaluate_route(perturbed_route, instance)
+        feasible, perturbed_cost = evaluate_route(perturbed_route, instance)
         if not feasible:
             continue
 
-        new_route, new_cost = vnd(perturbed_route, instance)
+        new_route, new_cost = vnd(perturbed_route, instance, initial_cost=perturbed_cost)
 
         if new_cost < best_cost:
             best_route = new_route
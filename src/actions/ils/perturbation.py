@@ -1,15 +1,25 @@
-import random
-from typing import List
+from typing import List, Optional
 
-def perturb_route(route: List[int], k: int = 2) -> List[int]:
+from src.utils.random_positions import distinct_random_positions
+
+def perturb_route(route: List[int], k: int = 2, out: Optional[List[int]] = None) -> List[int]:
     """
     Apply k random swaps in the route (keeping the depot fixed)
+
+    The swaps are applied in place on a single copy of the route. If out is
+    given (a list with the same length as route), the copy is written into it
+    and no new list is allocated.
     """
-    new_route = route.copy()
-    internal = new_route[1:-1]
+    if out is None:
+        out = route.copy()
+    else:
+        out[:] = route
+
+    # Inner positions only (1..m): 0 and len - 1 are the depot
+    m = len(out) - 2
 
     for _ in range(k):
-        i, j = random.sample(range(len(internal)), 2)
-        internal[i], internal[j] = internal[j], internal[i]
+        i, j = distinct_random_positions(m)
+        out[i + 1], out[j + 1] = out[j + 1], out[i + 1]
 
-    return [0] + internal + [0]
+    return out
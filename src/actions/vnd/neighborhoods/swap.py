@@ -1,13 +1,31 @@
 from typing import List
 
-def swap_neighborhood(route: List[int]) -> List[List[int]]:
-    neighbors = []
-    n = len(route)
 
-    for i in range(1, n - 1):
-        for j in range(i + 1, n - 1):
-            new_route = route.copy()
-            new_route[i], new_route[j] = new_route[j], new_route[i]
-            neighbors.append(new_route)
+def swap_delta(route: List[int], i: int, j: int, trip_time_matrix: List[List[int]]) -> int:
+    """
+    Cost change of swapping positions i < j, computed from the edges around
+    both positions only (the matrix may be asymmetric)
+    """
+    a, b, c, e = route[i - 1], route[i], route[j], route[j + 1]
 
-    return neighbors
+    if j == i + 1:
+        # Adjacent positions: a -> b -> c -> e becomes a -> c -> b -> e
+        old = trip_time_matrix[a][b] + trip_time_matrix[b][c] + trip_time_matrix[c][e]
+        new = trip_time_matrix[a][c] + trip_time_matrix[c][b] + trip_time_matrix[b][e]
+        return new - old
+
+    b_next, c_prev = route[i + 1], route[j - 1]
+    old = (
+        trip_time_matrix[a][b] + trip_time_matrix[b][b_next] +
+        trip_time_matrix[c_prev][c] + trip_time_matrix[c][e]
+    )
+    new = (
+        trip_time_matrix[a][c] + trip_time_matrix[c][b_next] +
+        trip_time_matrix[c_prev][b] + trip_time_matrix[b][e]
+    )
+    return new - old
+
+
+def apply_swap(route: List[int], i: int, j: int) -> None:
+    """Applies the swap move (i, j) in place"""
+    route[i], route[j] = route[j], route[i]
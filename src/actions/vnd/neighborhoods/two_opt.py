@@ -1,16 +1,21 @@
 from typing import List
 
-def two_opt_neighborhood(route: List[int]) -> List[List[int]]:
-    neighbors = []
-    n = len(route)
 
-    for i in range(1, n - 1):
-        for j in range(i + 1, n - 1):
-            new_route = (
-                route[:i] +
-                list(reversed(route[i:j + 1])) +
-                route[j + 1:]
-            )
-            neighbors.append(new_route)
+def reversal_gains(route: List[int], trip_time_matrix: List[List[int]]) -> List[int]:
+    """
+    Prefix sums of (reverse edge - forward edge) along the route, so the cost
+    change of traversing route[i..j] backwards is gains[j] - gains[i].
+    All zeros for a symmetric matrix.
+    """
+    gains = [0] * len(route)
+    total = 0
+    for p in range(1, len(route)):
+        u, v = route[p - 1], route[p]
+        total += trip_time_matrix[v][u] - trip_time_matrix[u][v]
+        gains[p] = total
+    return gains
 
-    return neighbors
+
+def apply_two_opt(route: List[int], i: int, j: int) -> None:
+    """Applies the 2-opt move (i, j) in place"""
+    route[i:j + 1] = route[i:j + 1][::-1]
@@ -1,47 +1,267 @@
-from typing import List, Callable, Tuple
+from typing import List, Callable, Optional, Tuple
 
 from src.utils.evaluator import evaluate_route
-from src.actions.vnd.neighborhoods.swap import swap_neighborhood
-from src.actions.vnd.neighborhoods.two_opt import two_opt_neighborhood
+from src.utils.compute_route_cost import count_evaluations
+from src.utils.feasibility import prefix_loads
+from src.actions.vnd.neighborhoods.swap import apply_swap
+from src.actions.vnd.neighborhoods.two_opt import reversal_gains, apply_two_opt
+
+# Route length from which the "auto" strategy switches to first-improvement
+FIRST_IMPROVEMENT_MIN_LENGTH = 30
+
+VND_STRATEGIES = ("best", "first", "auto")
+# Strategy used when vnd() is called without one (the metaheuristics registry,
+# ILS and VNS); set per agent process from the --vnd-strategy option of run.py
+_default_strategy = "best"
+
+
+def set_default_strategy(strategy: str) -> None:
+    """Sets the strategy used by vnd() calls that do not pass one"""
+    global _default_strategy
+    if strategy not in VND_STRATEGIES:
+        raise ValueError(f"[ERROR] Unknown VND strategy: {strategy}")
+    _default_strategy = strategy
+
+
+def _best_swap_move(
+    route: List[int],
+    trip_time_matrix: List[List[int]],
+    loads: List[int],
+    load_deltas: List[int],
+    max_capacity: int,
+    first: bool = False
+) -> Tuple[int, int, int, int]:
+    """
+    Scans every swap move and returns (best_delta, i, j, feasible_moves): the
+    best feasible improving move, or (0, -1, -1) if there is none, and the
+    number of feasible moves scanned.
+    With first=True the scan stops at the first feasible improving move.
+
+    The cost delta is the one of swap_delta, inlined into a single loop with
+    the matrix rows of position i bound once per outer iteration. Only the
+    loads at positions i..j-1 change (by the load delta difference of the two
+    nodes), so the capacity check uses their running min/max.
+    """
+    n = len(route)
+    best_delta, best_i, best_j = 0, -1, -1
+    feasible_moves = 0
+
+    for i in range(1, n - 2):
+        a, b, b_next = route[i - 1], route[i], route[i + 1]
+        row_a = trip_time_matrix[a]
+        row_b = trip_time_matrix[b]
+        removed_i = row_a[b] + row_b[b_next]
+        delta_b = load_deltas[b]
+        min_load = max_load = loads[i]
+
+        for j in range(i + 1, n - 1):
+            # Loads at positions i..j-1 shift by the delta difference
+            load = loads[j - 1]
+            if load < min_load:
+                min_load = load
+            elif load > max_load:
+                max_load = load
+            c = route[j]
+            shift = load_deltas[c] - delta_b
+            if min_load + shift < 0 or max_load + shift > max_capacity:
+                continue
+            feasible_moves += 1
+
+            e = route[j + 1]
+            row_c = trip_time_matrix[c]
+            if j == i + 1:
+                # Adjacent positions: a -> b -> c -> e becomes a -> c -> b -> e
+                delta = row_a[c] + row_c[b] + row_b[e] - row_a[b] - row_b[c] - row_c[e]
+            else:
+                c_prev = route[j - 1]
+                row_c_prev = trip_time_matrix[c_prev]
+                delta = (
+                    row_a[c] + row_c[b_next] + row_c_prev[b] + row_b[e]
+                    - removed_i - row_c_prev[c] - row_c[e]
+                )
+
+            if delta < best_delta:
+                best_delta, best_i, best_j = delta, i, j
+                if first:
+                    return best_delta, best_i, best_j, feasible_moves
+
+    return best_delta, best_i, best_j, feasible_moves
+
+
+def _best_two_opt_move(
+    route: List[int],
+    trip_time_matrix: List[List[int]],
+    loads: List[int],
+    gains: List[int],
+    max_capacity: int,
+    first: bool = False
+) -> Tuple[int, int, int, int]:
+    """
+    Scans every 2-opt move and returns (best_delta, i, j, feasible_moves): the
+    best feasible improving move, or (0, -1, -1) if there is none, and the
+    number of feasible moves scanned.
+    With first=True the scan stops at the first feasible improving move.
+
+    The cost delta replaces the two boundary edges and adds the direction
+    change of the reversed segment (reversal_gains), inlined into a single
+    loop with the matrix rows of position i bound once per outer iteration.
+    The capacity check uses the running min/max of the loads between i and j.
+    """
+    n = len(route)
+    best_delta, best_i, best_j = 0, -1, -1
+    feasible_moves = 0
+
+    for i in range(1, n - 2):
+        a, b = route[i - 1], route[i]
+        row_a = trip_time_matrix[a]
+        row_b = trip_time_matrix[b]
+        removed_ab = row_a[b]
+        gain_i = gains[i]
+        load_before = loads[i - 1]
+        min_load = max_load = loads[i]
+
+        for j in range(i + 1, n - 1):
+            # Capacity: the reversed segment is visited backwards, the load
+            # after position q of i..j-1 becomes load_before + loads[j] - loads[q]
+            load = loads[j - 1]
+            if load < min_load:
+                min_load = load
+            elif load > max_load:
+                max_load = load
+            base = load_before + loads[j]
+            if base - max_load < 0 or base - min_load > max_capacity:
+                continue
+            feasible_moves += 1
+
+            c, e = route[j], route[j + 1]
+            delta = (
+                row_a[c] + row_b[e] - removed_ab - trip_time_matrix[c][e]
+                + gains[j] - gain_i
+            )
+
+            if delta < best_delta:
+                best_delta, best_i, best_j = delta, i, j
+                if first:
+                    return best_delta, best_i, best_j, feasible_moves
+
+    return best_delta, best_i, best_j, feasible_moves
+
+
+def best_swap_neighbor(
+    route: List[int],
+    cost: float,
+    instance: dict,
+    first: bool = False
+) -> Tuple[List[int], float]:
+    """
+    Best-improvement search in the swap neighborhood
+    (first-improvement with first=True).
+
+    Each move is evaluated by its cost delta (four edges) instead of re-summing
+    the route. Every feasible scanned move counts as one objective function
+    evaluation, as evaluate_route would count it.
+    """
+    load_deltas = instance["load_deltas"]
+    best_delta, i, j, feasible_moves = _best_swap_move(
+        route,
+        instance["trip_time_matrix"],
+        prefix_loads(route, load_deltas),
+        load_deltas,
+        instance["max_capacity"],
+        first
+    )
+    count_evaluations(feasible_moves)
+
+    if i < 0:
+        return route, cost
+
+    best_route = route.copy()
+    apply_swap(best_route, i, j)
+    return best_route, cost + best_delta
+
+
+def best_two_opt_neighbor(
+    route: List[int],
+    cost: float,
+    instance: dict,
+    first: bool = False
+) -> Tuple[List[int], float]:
+    """
+    Best-improvement search in the 2-opt neighborhood
+    (first-improvement with first=True).
+
+    Each move is evaluated by its cost delta (two boundary edges plus the
+    direction change of the reversed segment, precomputed as prefix sums).
+    Every feasible scanned move counts as one objective function evaluation,
+    as evaluate_route would count it.
+    """
+    trip_time_matrix = instance["trip_time_matrix"]
+    best_delta, i, j, feasible_moves = _best_two_opt_move(
+        route,
+        trip_time_matrix,
+        prefix_loads(route, instance["load_deltas"]),
+        reversal_gains(route, trip_time_matrix),
+        instance["max_capacity"],
+        first
+    )
+    count_evaluations(feasible_moves)
+
+    if i < 0:
+        return route, cost
+
+    best_route = route.copy()
+    apply_two_opt(best_route, i, j)
+    return best_route, cost + best_delta
 
 
 def vnd(
     initial_route: List[int],
-    instance: dict
+    instance: dict,
+    initial_cost: Optional[float] = None,
+    strategy: Optional[str] = None
 ) -> Tuple[List[int], float]:
     """
     Variable Neighborhood Descent (VND)
+
+    initial_cost: cost of initial_route if the caller has already evaluated it
+                  and found it feasible; skips the initial evaluation
+    strategy:
+        - "best"  : move to the best improving neighbor (full neighborhood scan)
+        - "first" : move to the first improving neighbor found
+        - "auto"  : "best" for routes shorter than FIRST_IMPROVEMENT_MIN_LENGTH, else "first"
+        - None    : the process default (see set_default_strategy), "best" unless changed
     """
 
-    neighborhoods: List[Callable[[List[int]], List[List[int]]]] = [
-        swap_neighborhood,
-        two_opt_neighborhood
+    if strategy is None:
+        strategy = _default_strategy
+
+    if strategy == "best":
+        first = False
+    elif strategy == "first":
+        first = True
+    elif strategy == "auto":
+        first = len(initial_route) >= FIRST_IMPROVEMENT_MIN_LENGTH
+    else:
+        raise ValueError(f"[ERROR] Unknown VND strategy: {strategy}")
+
+    neighborhoods: List[Callable[[List[int], float, dict, bool], Tuple[List[int], float]]] = [
+        best_swap_neighbor,
+        best_two_opt_neighbor
     ]
 
-    # Initial evaluation
-    feasible, current_cost = evaluate_route(initial_route, instance)
-    if not feasible:
-        raise ValueError("VND received an infeasible initial route")
+    # Initial evaluation (unless already done by the caller)
+    if initial_cost is None:
+        feasible, current_cost = evaluate_route(initial_route, instance)
+        if not feasible:
+            raise ValueError("VND received an infeasible initial route")
+    else:
+        current_cost = initial_cost
 
     current_route = initial_route.copy()
     k = 0
 
     while k < len(neighborhoods):
-        neighborhood = neighborhoods[k]
-
-        best_route = current_route
-        best_cost = current_cost
-
-        for neighbor in neighborhood(current_route):
-            feasible, cost = evaluate_route(neighbor, instance)
-
-            # Feasibility filter
-            if not feasible:
-                continue
-
-            if cost < best_cost:
-                best_route = neighbor
-                best_cost = cost
+        best_route, best_cost = neighborhoods[k](current_route, current_cost, instance, first)
 
         if best_cost < current_cost:
             current_route = best_route
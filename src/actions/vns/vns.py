@@ -2,9 +2,23 @@ from typing import List, Tuple, Callable
 import random
 
 from src.utils.evaluator import evaluate_route
+from src.utils.random_positions import distinct_random_positions
 from src.actions.vnd.vnd import vnd
-from src.actions.vnd.neighborhoods.swap import swap_neighborhood
-from src.actions.vnd.neighborhoods.two_opt import two_opt_neighborhood
+from src.actions.vnd.neighborhoods.swap import apply_swap
+from src.actions.vnd.neighborhoods.two_opt import apply_two_opt
+
+
+def random_move(route: List[int]) -> Tuple[int, int] | None:
+    """
+    Draws a uniform random move (i, j), i < j, over the inner positions of the
+    route; the same pairs the swap and 2-opt neighborhoods enumerate.
+    Returns None if the route has fewer than two inner positions.
+    """
+    m = len(route) - 2
+    if m < 2:
+        return None
+    i, j = distinct_random_positions(m)
+    return (i + 1, j + 1) if i < j else (j + 1, i + 1)
 
 
 def vns(
@@ -32,9 +46,10 @@ def vns(
     if seed is not None:
         random.seed(seed)
 
-    neighborhoods: List[Callable[[List[int]], List[List[int]]]] = [
-        swap_neighborhood,
-        two_opt_neighborhood,
+    # Shaking applies one random move of each neighborhood (in place on a copy)
+    neighborhoods: List[Callable[[List[int], int, int], None]] = [
+        apply_swap,
+        apply_two_opt,
     ]
 
     # Initial evaluation
@@ -51,18 +66,21 @@ def vns(
         # traverse neighborhoods
         k = 0
         while k < len(neighborhoods):
-            neighborhood = neighborhoods[k]
+            apply_move = neighborhoods[k]
 
             # shaking: try to generate a random feasible neighbor
             shaken_route = None
+            shaken_cost = None
             for _ in range(max_shake_tries):
-                neighbors = neighborhood(current_route)
-                if not neighbors:
+                move = random_move(current_route)
+                if move is None:
                     break
-                candidate = random.choice(neighbors)
-                feasible_candidate, _ = evaluate_route(candidate, instance)
+                candidate = current_route.copy()
+                apply_move(candidate, *move)
+                feasible_candidate, candidate_cost = evaluate_route(candidate, instance)
                 if feasible_candidate:
                     shaken_route = candidate
+                    shaken_cost = candidate_cost
                     break
 
             if shaken_route is None:
@@ -71,7 +89,7 @@ def vns(
                 continue
 
             # intensification with VND
-            new_route, new_cost = vnd(shaken_route, instance)
+            new_route, new_cost = vnd(shaken_route, instance, initial_cost=shaken_cost)
 
             # acceptance if improved
             if new_cost < current_cost:
@@ -1,17 +1,37 @@
-from typing import Dict, List, Optional
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
 
 
 class ActionStats:
     """
     Statistics associated with a metaheuristic (action).
+
+    Read-only view: the values live in the per-field lists of the owning
+    AgentBeliefs, at the action's index.
     """
 
-    def __init__(self, name: str):
+    __slots__ = ("name", "_beliefs", "_index")
+
+    def __init__(self, name: str, beliefs: "AgentBeliefs", index: int):
         self.name = name
-        self.times_selected: int = 0
-        self.times_success: int = 0
-        self.total_improvement: float = 0.0
-        self.last_improvement: float = 0.0
+        self._beliefs = beliefs
+        self._index = index
+
+    @property
+    def times_selected(self) -> int:
+        return self._beliefs._times_selected[self._index]
+
+    @property
+    def times_success(self) -> int:
+        return self._beliefs._times_success[self._index]
+
+    @property
+    def total_improvement(self) -> float:
+        return self._beliefs._total_improvement[self._index]
+
+    @property
+    def last_improvement(self) -> float:
+        return self._beliefs._last_improvement[self._index]
 
     @property
     def success_rate(self) -> float:
@@ -41,11 +61,28 @@ class AgentBeliefs:
     ):
         self.agent_id = agent_id
 
-        # Statistics of the actions (metaheuristics)
+        # Statistics of the actions (metaheuristics), one list per field
+        # indexed by action ordinal
+        self._names: Tuple[str, ...] = tuple(metaheuristics)
+        self._index: Dict[str, int] = {name: i for i, name in enumerate(self._names)}
+        n_actions = len(self._names)
+        self._times_selected: List[int] = [0] * n_actions
+        self._times_success: List[int] = [0] * n_actions
+        self._total_improvement: List[float] = [0.0] * n_actions
+        self._last_improvement: List[float] = [0.0] * n_actions
+
         self.actions: Dict[str, ActionStats] = {
-            name: ActionStats(name) for name in metaheuristics
+            name: ActionStats(name, self, i) for name, i in self._index.items()
         }
 
+        # Scores are only recomputed after update_after_action
+        self._scores_cache: Optional[Dict[str, float]] = None  # built on demand from the values
+        self._score_values_cache: List[float] = []
+        self._max_score_cache: float = 0.0
+        self._cumulative_scores_cache: Optional[List[float]] = None  # built on demand from the values
+        self._scores_epsilon: Optional[float] = None  # epsilon of the cached scores (None = stale)
+        self._best_action_cache: Optional[str] = None
+
         # Current state of the agent
         self.current_route: Optional[List[int]] = None
         self.current_cost: float = float("inf")
@@ -58,6 +95,9 @@ class AgentBeliefs:
         self.path_relinking_prob_p_best: float = 0.9
         self.path_relinking_prob_g_best: float = 0.1
 
+        # Number of cycles run by the agent
+        self.cycle_count: int = 0
+
         # Evaluation budget tracking
         self.evaluation_count: int = 0
         self.evaluation_budget: int = 0  # Will be set by set_evaluation_budget()
@@ -75,28 +115,53 @@ class AgentBeliefs:
         """
         Update the beliefs after the execution of a metaheuristic.
         """
-        if action_name not in self.actions:
+        i = self._index.get(action_name)
+        if i is None:
             raise ValueError(f"[ERROR] Action '{action_name}' is not registered")
         
-        stats = self.actions[action_name]
-        stats.times_selected += 1
+        self._times_selected[i] += 1
 
         improvement = old_cost - new_cost
-        stats.last_improvement = improvement
+        self._last_improvement[i] = improvement
 
         if improvement > 0:
-            stats.times_success += 1
-            stats.total_improvement += improvement
+            self._times_success[i] += 1
+            self._total_improvement[i] += improvement
+
+        self._scores_epsilon = None
+        self._best_action_cache = None
 
     # ------------------------------------------------------------------
     # Queries for the Decision Method
     # ------------------------------------------------------------------
 
+    @property
+    def action_names(self) -> Tuple[str, ...]:
+        """Names of the registered actions, in registration order"""
+        return self._names
+
     def get_action_stats(self, action_name: str) -> ActionStats:
         if action_name not in self.actions:
             raise ValueError(f"[ERROR] Action '{action_name}' is not registered")
         return self.actions[action_name]
 
+    def _score_values(self, epsilon: float) -> List[float]:
+        """Scores of the actions (see get_all_action_scores), in action ordinal order"""
+        scores = []
+        for selected, successes, total_improvement in zip(
+            self._times_selected, self._times_success, self._total_improvement
+        ):
+            # Success rate scaled to 0-10 range (primary factor for dynamic scoring)
+            success_rate_score = (successes / selected if selected else 0.0) * 10.0
+            
+            # Normalized average improvement (divided by 100 to balance)
+            normalized_improvement = (total_improvement / successes if successes else 0.0) / 100.0
+            
+            # Combined score: success rate (primary) + success count + normalized improvement,
+            # plus epsilon to ensure all actions have a chance (exploration)
+            scores.append(success_rate_score + successes + normalized_improvement + epsilon)
+        return scores
+
     def get_all_action_scores(self, epsilon: float = 1.0) -> Dict[str, float]:
         """
         Returns a score for each action with minimum epsilon value for exploration.
@@ -106,33 +171,57 @@ class AgentBeliefs:
         the success rate decreases with more unsuccessful attempts.
         
         epsilon: minimum score value added to all actions to ensure exploration
+
+        The scores are cached until the next update_after_action; the returned
+        dict is shared and must not be modified by the caller.
         """
-        scores = {}
-        for name, stats in self.actions.items():
-            # Success rate scaled to 0-10 range (primary factor for dynamic scoring)
-            success_rate_score = stats.success_rate * 10.0
-            
-            # Success count (absolute number of successes)
-            success_count = stats.times_success
-            
-            # Normalized average improvement (divided by 100 to balance)
-            normalized_improvement = stats.avg_improvement / 100.0
-            
-            # Combined score: success rate (primary) + success count + normalized improvement
-            base_score = success_rate_score + success_count + normalized_improvement
-            
-            # Add epsilon to ensure all actions have a chance (exploration)
-            scores[name] = base_score + epsilon
-        return scores
+        self._refresh_scores(epsilon)
+        if self._scores_cache is None:
+            self._scores_cache = dict(zip(self._names, self._score_values_cache))
+        return self._scores_cache
+
+    def get_action_weights(self, epsilon: float = 1.0) -> Tuple[Tuple[str, ...], List[float], float]:
+        """
+        Returns (action names, scores in the same order, highest score), the
+        form used by the roulette selection. Cached like get_all_action_scores;
+        the returned list must not be modified by the caller.
+        """
+        self._refresh_scores(epsilon)
+        return self._names, self._score_values_cache, self._max_score_cache
+
+    def get_cumulative_action_weights(self, epsilon: float = 1.0) -> Tuple[Tuple[str, ...], List[float]]:
+        """
+        Returns (action names, running sums of their scores), the form used by
+        the binary-search roulette selection. Cached like get_all_action_scores;
+        the returned list must not be modified by the caller.
+        """
+        self._refresh_scores(epsilon)
+        if self._cumulative_scores_cache is None:
+            self._cumulative_scores_cache = list(accumulate(self._score_values_cache))
+        return self._names, self._cumulative_scores_cache
+
+    def _refresh_scores(self, epsilon: float) -> None:
+        """Recomputes the cached scores if they are stale or for another epsilon"""
+        if self._scores_epsilon == epsilon:
+            return
+        values = self._score_values(epsilon)
+        self._score_values_cache = values
+        self._max_score_cache = max(values, default=0.0)
+        self._scores_cache = None
+        self._cumulative_scores_cache = None
+        self._scores_epsilon = epsilon
 
     def get_best_action(self) -> str:
         """
         Returns the action with the highest current score.
         """
-        scores = self.get_all_action_scores()
-        if not scores:
-            raise ValueError("[ERROR] No actions available to select")
-        return max(scores, key=scores.get)
+        if self._best_action_cache is None:
+            if not self._names:
+                raise ValueError("[ERROR] No actions available to select")
+            scores = self._score_values(1.0)
+            best = max(range(len(scores)), key=scores.__getitem__)
+            self._best_action_cache = self._names[best]
+        return self._best_action_cache
 
     # ------------------------------------------------------------------
     # State of the agent
@@ -9,12 +9,19 @@ from src.utils.evaluation_counter import set_agent_context, clear_agent_context
 
 from src.methods.path_relinking import path_relinking
 from src.utils.evaluator import evaluate_route
+from src.utils.env_flags import env_flag
 
 # Available Metaheuristics
 from src.actions.vnd.vnd import vnd
 from src.actions.ils.ils import ils
 from src.actions.vns.vns import vns
 
+# Re-evaluate the solution returned by each metaheuristic (debugging aid)
+VALIDATE_ACTIONS = env_flag("VRP_VALIDATE")
+
+# Run the velocity operator (path-relinking) every this many cycles of an agent
+PATH_RELINKING_INTERVAL = 1
+
 # Metaheuristics (Actions) registry
 METAHEURISTICS: Dict[str, Callable[[List[int], dict], Tuple[List[int], float]]] = {
     "VND": vnd,
@@ -22,6 +29,10 @@ METAHEURISTICS: Dict[str, Callable[[List[int], dict], Tuple[List[int], float]]]
     "VNS": vns,
 }
 
+# Per-action log lines of the cycle, built once instead of formatted every cycle
+CHOSEN_ACTION_LOG: Dict[str, str] = {name: f"---> Chosen Metaheuristic: {name}" for name in METAHEURISTICS}
+ACTION_PHASE_LOG: Dict[str, str] = {name: f"[Action - Execution of {name} ]" for name in METAHEURISTICS}
+
 # ---------------------------------------------------------------------
 # Agent Cognitive Cycle
 # ---------------------------------------------------------------------
@@ -45,6 +56,9 @@ def run_agent_cycle(
     # Set agent context for evaluation counting
     set_agent_context(beliefs.agent_id)
 
+    # Access global_best from module to ensure we get the injected instance
+    global_best = blackboard.global_best
+
     try:
         # ------------------------------------------------------------
         # Initial state
@@ -59,9 +73,11 @@ def run_agent_cycle(
         # 1 - Decision Method
         # ------------------------------------------------------------
         logger = get_logger(beliefs.agent_id)
+        # Bound once: the cycle logs a dozen messages
+        log, log_phase = logger.log, logger.log_phase
         action_name = decision_method(beliefs, logger=logger)
-        logger.log_phase("[Decision Method] ")
-        logger.log(f"---> Chosen Metaheuristic: {action_name}")
+        log_phase("[Decision Method] ")
+        log(CHOSEN_ACTION_LOG.get(action_name) or f"---> Chosen Metaheuristic: {action_name}")
         
         # Validate that the chosen action is available for this agent
         if action_name not in beliefs.actions:
@@ -70,28 +86,31 @@ def run_agent_cycle(
                 f"Available: {list(beliefs.actions.keys())}"
             )
         
-        if action_name not in METAHEURISTICS:
+        action_fn = METAHEURISTICS.get(action_name)
+        if action_fn is None:
             raise ValueError(f"[ERROR] Metaheuristic '{action_name}' is not registered in METAHEURISTICS")
-        action_fn = METAHEURISTICS[action_name]
 
         # ------------------------------------------------------------
         # 2 - Execution of the Metaheuristic (Action)
         # ------------------------------------------------------------
-        logger.log_phase(f"[Action - Execution of {action_name} ]")
+        log_phase(ACTION_PHASE_LOG[action_name])
         new_route, new_cost = action_fn(current_route, instance)
         
-        # Validate feasibility of the solution returned by the metaheuristic
-        feasible, validated_cost = evaluate_route(new_route, instance)
-        if not feasible:
-            logger.log(f"[WARNING] Metaheuristic '{action_name}' returned an infeasible solution. Keeping current solution.")
-            new_route, new_cost = current_route, current_cost
-        else:
-            new_cost = validated_cost  # Use validated cost
+        # The metaheuristics only return feasible routes with their evaluated
+        # cost; re-validating costs one more full evaluation per cycle, so it
+        # is only done when VRP_VALIDATE is enabled (debugging)
+        if VALIDATE_ACTIONS:
+            feasible, validated_cost = evaluate_route(new_route, instance)
+            if not feasible:
+                log(f"[WARNING] Metaheuristic '{action_name}' returned an infeasible solution. Keeping current solution.")
+                new_route, new_cost = current_route, current_cost
+            else:
+                new_cost = validated_cost  # Use validated cost
 
         # ------------------------------------------------------------
         # 3 - Learning Method
         # ------------------------------------------------------------
-        logger.log_phase("[Learning Method - Updating beliefs after action]")
+        log_phase("[Learning Method - Updating beliefs after action]")
         beliefs.update_after_action(
             action_name=action_name,
             old_cost=current_cost,
@@ -103,11 +122,15 @@ def run_agent_cycle(
         # ------------------------------------------------------------
         # 4 - Velocity Operator (Path-Relinking)
         # ------------------------------------------------------------
-        logger.log_phase("[Velocity Operator (Path-Relinking)]")
+        log_phase("[Velocity Operator (Path-Relinking)]")
+        
+        # Path-relinking only runs every PATH_RELINKING_INTERVAL cycles
+        beliefs.cycle_count += 1
+        relink = beliefs.cycle_count % PATH_RELINKING_INTERVAL == 0
         
         # Get both p_best and g_best
         p_best_route, p_best_cost = beliefs.p_best_route, beliefs.p_best_cost
-        g_best_route, g_best_cost, _ = blackboard.global_best.get()
+        g_best_route, g_best_cost, _ = global_best.get() if relink else (None, float("inf"), None)
         
         # Store origin cost before path-relinking (cost after metaheuristic)
         origin_cost = new_cost
@@ -119,29 +142,31 @@ def run_agent_cycle(
         target_route = None
         used_p_best = False
         
-        if p_best_route is not None and g_best_route is not None:
+        if not relink:
+            log(f"---> Path-relinking runs every {PATH_RELINKING_INTERVAL} cycles, skipping")
+        elif p_best_route is not None and g_best_route is not None:
             # Both exist: use probability-based selection
             if random.random() < beliefs.path_relinking_prob_p_best:
                 target_route = p_best_route
                 used_p_best = True
-                logger.log(f"---> Selected target: p_best (prob_p_best={beliefs.path_relinking_prob_p_best:.3f})")
+                log(f"---> Selected target: p_best (prob_p_best={beliefs.path_relinking_prob_p_best:.3f})")
             else:
                 target_route = g_best_route
                 used_p_best = False
-                logger.log(f"---> Selected target: g_best (prob_g_best={beliefs.path_relinking_prob_g_best:.3f})")
+                log(f"---> Selected target: g_best (prob_g_best={beliefs.path_relinking_prob_g_best:.3f})")
         elif p_best_route is not None:
             # Only p_best exists: use it as fallback
             target_route = p_best_route
             used_p_best = True
-            logger.log("---> Selected target: p_best (g_best not available, using fallback)")
+            log("---> Selected target: p_best (g_best not available, using fallback)")
         elif g_best_route is not None:
             # Only g_best exists: use it as fallback
             target_route = g_best_route
             used_p_best = False
-            logger.log("---> Selected target: g_best (p_best not available, using fallback)")
+            log("---> Selected target: g_best (p_best not available, using fallback)")
         else:
             # Neither exists: skip path-relinking
-            logger.log("---> No p_best or g_best found, skipping path-relinking")
+            log("---> No p_best or g_best found, skipping path-relinking")
         
         # Execute path-relinking if target is available
         if target_route is not None:
@@ -162,12 +187,17 @@ def run_agent_cycle(
                     raise ValueError(f"[ERROR] Metaheuristic '{best_action}' is not registered in METAHEURISTICS")
                 return METAHEURISTICS[best_action](route, instance)
 
-            final_route, final_cost = path_relinking(
-                origin=new_route,
-                target=target_route,
-                instance=instance,
-                intensification_method=opportunistic_intensification
-            )
+            if target_route == new_route:
+                # Empty path: path-relinking would return the origin unchanged
+                final_route, final_cost = new_route, new_cost
+            else:
+                final_route, final_cost = path_relinking(
+                    origin=new_route,
+                    target=target_route,
+                    instance=instance,
+                    intensification_method=opportunistic_intensification,
+                    origin_cost=new_cost
+                )
             
             # Check for improvement
             improved = final_cost < origin_cost
@@ -177,40 +207,38 @@ def run_agent_cycle(
             
             # Log results
             if improved:
-                logger.log(f"---> Path-relinking IMPROVED: {origin_cost:.2f} -> {final_cost:.2f}")
+                log(f"---> Path-relinking IMPROVED: {origin_cost:.2f} -> {final_cost:.2f}")
             else:
-                logger.log(f"---> Path-relinking NO improvement: {origin_cost:.2f} -> {final_cost:.2f}")
+                log(f"---> Path-relinking NO improvement: {origin_cost:.2f} -> {final_cost:.2f}")
             
-            logger.log(f"---> Updated probabilities: prob_p_best={beliefs.path_relinking_prob_p_best:.3f}, prob_g_best={beliefs.path_relinking_prob_g_best:.3f}")
+            log(f"---> Updated probabilities: prob_p_best={beliefs.path_relinking_prob_p_best:.3f}, prob_g_best={beliefs.path_relinking_prob_g_best:.3f}")
 
         beliefs.update_current_solution(final_route, final_cost)
 
         # ------------------------------------------------------------
         # 5 - Update of p_best
         # ------------------------------------------------------------
-        logger.log_phase("[Update of p_best]")
+        log_phase("[Update of p_best]")
         old_p_best_cost = beliefs.p_best_cost
         p_best_updated = beliefs.try_update_pbest(final_route, final_cost)
         
         if p_best_updated:
-            logger.log(f"---> p_best UPDATED: From {old_p_best_cost} to {beliefs.p_best_cost}")
+            log(f"---> p_best UPDATED: From {old_p_best_cost} to {beliefs.p_best_cost}")
         
         # ------------------------------------------------------------
         # 6 - Update of g_best (Blackboard)
         # ------------------------------------------------------------
-        logger.log_phase("[Update of g_best (Blackboard)]")
-        # Access global_best from module to ensure we get the injected instance
-        g_route_before, g_cost_before, g_agent_before = blackboard.global_best.get()
-        g_best_updated = blackboard.global_best.try_update(
+        log_phase("[Update of g_best (Blackboard)]")
+        # Only the cost is needed for the log: no route copy
+        g_cost_before = global_best.get_cost()
+        g_best_updated = global_best.try_update(
             candidate_route=final_route,
             candidate_cost=final_cost,
             agent_id=beliefs.agent_id
         )
         
         if g_best_updated:
-            logger.log(f"---> g_best UPDATED: From {g_cost_before if g_cost_before != float('inf') else 'inf'} to {final_cost} (by agent {beliefs.agent_id})")
-        else:
-            current_g_cost = g_cost_before if g_cost_before != float('inf') else 'inf'
+            log(f"---> g_best UPDATED: From {g_cost_before if g_cost_before != float('inf') else 'inf'} to {final_cost} (by agent {beliefs.agent_id})")
 
     finally:
         # Clear agent context after cycle completion
@@ -7,15 +7,20 @@ from src.utils.load_instance import load_instance
 # Active agents registry
 AGENTS = {}
 
+# Instances already loaded in this process, by path (shared read-only by the agents)
+_INSTANCES = {}
+
 def initialize_agent(agent_id: str, instance_path: str = "instances/50.json"):
     """
     Initialize an agent with a specific instance.
     
     Args:
         agent_id: Agent identifier
-        instance_path: Path to the instance file
+        instance_path: Path to the instance file (parsed once per process)
     """
-    instance = load_instance(instance_path)
+    instance = _INSTANCES.get(instance_path)
+    if instance is None:
+        instance = _INSTANCES[instance_path] = load_instance(instance_path)
 
     # Generate initial feasible route with validation
     max_attempts = 100
@@ -1,29 +1,55 @@
 import random
-from typing import Dict, Optional
+from bisect import bisect_right
+from typing import Optional, Sequence
 
 from src.agent_beliefs import AgentBeliefs
 
 
-def roulette_wheel_selection(scores: Dict[str, float]) -> str:
+def roulette_wheel_selection(
+    actions: Sequence[str],
+    weights: Sequence[float],
+    max_weight: float
+) -> str:
     """
-    Selection by proportional roulette based on scores.
+    Selection by proportional roulette based on weights (scores).
+
+    Uses stochastic acceptance: draw an action uniformly and accept it with
+    probability weight / max_weight, repeating until one is accepted. The
+    selection probabilities are the same as with the cumulative scan, in O(1)
+    expected time and without summing the weights.
     """
-    total_score = sum(scores.values())
+    n = len(actions)
+
+    # If all weights are zero we select a random action
+    if max_weight <= 0:
+        return actions[random.randrange(n)]
+
+    while True:
+        i = random.randrange(n)
+        if random.random() * max_weight < weights[i]:
+            return actions[i]
 
-    # If all scores are zero we select a random action
-    if total_score == 0:
-        return random.choice(list(scores.keys()))
 
-    r = random.uniform(0, total_score)
-    cumulative = 0.0
+def cumulative_roulette_selection(
+    actions: Sequence[str],
+    cumulative_weights: Sequence[float]
+) -> str:
+    """
+    Selection by proportional roulette based on the running sums of the
+    weights (scores), found by binary search in O(log n).
+
+    Same selection probabilities as roulette_wheel_selection; preferable with
+    many actions or very uneven weights, where stochastic acceptance rejects
+    often.
+    """
+    total = cumulative_weights[-1] if cumulative_weights else 0.0
 
-    for action, score in scores.items():
-        cumulative += score
-        if r <= cumulative:
-            return action
+    # If all weights are zero we select a random action
+    if total <= 0:
+        return actions[random.randrange(len(actions))]
 
-    # If no action is selected we select a random action
-    return random.choice(list(scores.keys()))
+    i = bisect_right(cumulative_weights, random.random() * total)
+    return actions[min(i, len(actions) - 1)]  # guard against rounding up to total
 
 
 def decision_method(
@@ -37,6 +63,9 @@ def decision_method(
 
     strategy:
         - "roulette" : proportional roulette with epsilon-greedy exploration
+                       (stochastic acceptance)
+        - "roulette_bisect" : same as "roulette", selecting by binary search
+                              over the cumulative scores
         - "greedy"   : best action at current state
         - "random"   : random choice
     
@@ -45,20 +74,21 @@ def decision_method(
     """
 
     if strategy == "random":
-        return random.choice(list(beliefs.actions.keys()))
+        return random.choice(beliefs.action_names)
 
     if strategy == "greedy":
         return beliefs.get_best_action()
 
-    if strategy == "roulette":
+    if strategy in ("roulette", "roulette_bisect"):
         # Epsilon-greedy: randomly select an action with probability epsilon_exploration
         if random.random() < epsilon_exploration:
-            return random.choice(list(beliefs.actions.keys()))
+            return random.choice(beliefs.action_names)
         
         # Exploitation: use scores with minimum epsilon value for exploration
-        scores = beliefs.get_all_action_scores(epsilon=1.0)
-        if logger:
-            logger.log(f"Scores: {scores}")
-        return roulette_wheel_selection(scores)
+        if logger and logger.is_enabled():
+            logger.log(f"Scores: {beliefs.get_all_action_scores(epsilon=1.0)}")
+        if strategy == "roulette_bisect":
+            return cumulative_roulette_selection(*beliefs.get_cumulative_action_weights(epsilon=1.0))
+        return roulette_wheel_selection(*beliefs.get_action_weights(epsilon=1.0))
 
     raise ValueError(f"[ERROR] Unknown decision strategy: {strategy}")
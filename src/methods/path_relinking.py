@@ -1,32 +1,55 @@
-from typing import List, Callable, Tuple
+from typing import List, Callable, Optional, Tuple
 
 from src.utils.evaluator import evaluate_route
+from src.utils.compute_route_cost import count_evaluations
+from src.utils.feasibility import prefix_loads
+from src.actions.vnd.neighborhoods.swap import swap_delta
 
 def path_relinking(
     origin: List[int],
     target: List[int],
     instance: dict,
-    intensification_method: Callable[[List[int], dict], Tuple[List[int], float]]
+    intensification_method: Callable[[List[int], dict], Tuple[List[int], float]],
+    origin_cost: Optional[float] = None
 ) -> Tuple[List[int], float]:
     """
     Path-Relinking for permutation problems
 
     origin  : Ps — current position of the agent
     target  : Pt — g_best or elite solution
+    origin_cost : cost of origin if the caller has already evaluated it and
+                  found it feasible; skips the baseline evaluation
     """
 
-    # Defensive copy
+    # Working copy (the only copy of origin; origin itself is never modified)
     current = origin.copy()
 
-    # Evaluation of the origin (baseline)
-    origin_feasible, origin_cost = evaluate_route(origin, instance)
-    if not origin_feasible:
-        raise ValueError("Path-Relinking started with an infeasible solution")
+    # Position of each node in current, kept in sync with the swaps
+    position = [0] * (max(current) + 1)
+    for k, node in enumerate(current):
+        position[node] = k
+
+    # Evaluation of the origin (baseline), unless already done by the caller
+    if origin_cost is None:
+        origin_feasible, origin_cost = evaluate_route(origin, instance)
+        if not origin_feasible:
+            raise ValueError("Path-Relinking started with an infeasible solution")
 
     # Best solution along the path
-    best_route = origin.copy()
+    best_route = origin
     best_cost = origin_cost
 
+    # Swaps are evaluated incrementally: the cost by the delta of the edges
+    # around both positions, the capacity by updating the loads between them.
+    # The path may cross infeasible routes, so the number of positions whose
+    # load is out of range is tracked (the route is feasible when it is 0).
+    trip_time_matrix = instance["trip_time_matrix"]
+    load_deltas = instance["load_deltas"]
+    max_capacity = instance["max_capacity"]
+    loads = prefix_loads(current, load_deltas)
+    current_cost = origin_cost
+    violations = 0
+
     # Ignore the depot (position 0 and last)
     positions = range(1, len(origin) - 1)
 
@@ -37,16 +60,26 @@ def path_relinking(
             continue
 
         # Find the position of the desired node
-        j = current.index(target[i])
+        j = position[target[i]]
+
+        # Directed swap (j > i: positions before i already match the target)
+        current_cost += swap_delta(current, i, j, trip_time_matrix)
+        shift = load_deltas[current[j]] - load_deltas[current[i]]
+        if shift:
+            for p in range(i, j):
+                old_load = loads[p]
+                new_load = old_load + shift
+                loads[p] = new_load
+                violations += (new_load < 0 or new_load > max_capacity) - (old_load < 0 or old_load > max_capacity)
 
-        # Directed swap
         current[i], current[j] = current[j], current[i]
-
-        feasible, current_cost = evaluate_route(current, instance)
+        position[current[i]] = i
+        position[current[j]] = j
 
         # Infeasible solution -> ignore and continue
-        if not feasible:
+        if violations:
             continue
+        count_evaluations(1)
 
         # Update best solution along the path
         if current_cost < best_cost:
@@ -55,8 +88,10 @@ def path_relinking(
 
         # Opportunistic stop (better than Ps)
         if current_cost < origin_cost:
+            # current is not used after this point, so it is handed over
+            # without a copy (best_route holds its own copy)
             intensified_route, intensified_cost = intensification_method(
-                current.copy(), instance
+                current, instance
             )
 
             feasible_int, cost_int = evaluate_route(intensified_route, instance)
@@ -1,47 +1,39 @@
 from typing import List, Optional
-import copy
+import multiprocessing as mp
+import struct
+from multiprocessing.shared_memory import SharedMemory
 from threading import Lock
 
 
 class GlobalBest:
     """
-    Class to manage the global best (g_best) shared between agents.
+    Class to manage the global best (g_best) shared between agents of a
+    single process (thread-safe, uses Lock() default of threading).
     
-    Supports two modes:
-    1. Single-threaded: uses Lock() default of threading
-    2. Multi-process: receives a manager from multiprocessing
+    For agents in several processes use SharedGlobalBest, which has the same
+    interface and keeps the g_best in a shared memory block.
     """
     
-    def __init__(self, manager=None):
-        """
-        Initializes GlobalBest.
-        
-        Args:
-            manager: If provided (multiprocessing.Manager), uses shared structures.
-                     If None, uses thread-safe structures for single-process.
-        """
-        if manager is not None:
-            # Multi-process mode
-            self._data = manager.dict({
-                "route": None,
-                "cost": float("inf"),
-                "agent_id": None
-            })
-            self._lock = manager.Lock()
-        else:
-            # Single-process mode (thread-safe)
-            self._data = {
-                "route": None,
-                "cost": float("inf"),
-                "agent_id": None
-            }
-            self._lock = Lock()
+    def __init__(self):
+        """Initializes an empty GlobalBest."""
+        self._data = {
+            "route": None,
+            "cost": float("inf"),
+            "agent_id": None
+        }
+        self._lock = Lock()
 
     def try_update(self, candidate_route, candidate_cost, agent_id):
         """Tries to update the g_best if the candidate is better"""
+        # Unlocked pre-check (reading the cost is atomic); the route is copied
+        # before taking the lock and the cost checked again under it
+        if candidate_cost >= self._data["cost"]:
+            return False
+        # Routes are flat lists of ints: a shallow copy is a full copy
+        route = list(candidate_route)
         with self._lock:
             if candidate_cost < self._data["cost"]:
-                self._data["route"] = copy.deepcopy(candidate_route)
+                self._data["route"] = route
                 self._data["cost"] = candidate_cost
                 self._data["agent_id"] = agent_id
                 return True
@@ -52,11 +44,15 @@ class GlobalBest:
         with self._lock:
             route = self._data["route"]
             return (
-                copy.deepcopy(route) if route else None,
+                list(route) if route else None,
                 self._data["cost"],
                 self._data["agent_id"]
             )
 
+    def get_cost(self) -> float:
+        """Returns the current g_best cost (reading it is atomic, no lock needed)"""
+        return self._data["cost"]
+
     def reset(self):
         """Resets the g_best"""
         with self._lock:
@@ -65,6 +61,131 @@ class GlobalBest:
             self._data["agent_id"] = None
 
 
+class SharedGlobalBest:
+    """
+    g_best shared between agent processes through a SharedMemory block.
+    
+    Same interface as GlobalBest, but get() and try_update() read and write
+    the shared buffer directly (no Manager proxy, no pickling). Only a
+    multiprocessing lock is shared besides the buffer.
+    
+    Buffer layout:
+        cost (float64) | version (int64) | route length (int64) | agent_id length (int64) |
+        agent_id (utf-8, AGENT_ID_SIZE bytes) | route (int32 x route_capacity)
+    
+    The version is incremented on every change, so readers can poll it
+    (get_version) and only copy the full snapshot when it moved.
+    
+    The process that creates it owns the block and must call close() when
+    done; processes receiving it as an argument attach to the same block.
+    """
+    
+    AGENT_ID_SIZE = 64
+    _HEADER = struct.Struct("dqqq")
+    _ROUTE_OFFSET = _HEADER.size + AGENT_ID_SIZE
+    
+    def __init__(self, route_capacity: int, lock=None):
+        """
+        Creates the shared block (empty g_best).
+        
+        Args:
+            route_capacity: Maximum route length (number of nodes + 1 for the return to the depot)
+            lock: Lock shared with the agent processes (e.g. mp_context.Lock()).
+                  If None, a lock from the default multiprocessing context is created.
+        """
+        self._route_capacity = route_capacity
+        self._lock = lock if lock is not None else mp.Lock()
+        self._shm = SharedMemory(create=True, size=self._ROUTE_OFFSET + 4 * route_capacity)
+        self._owner = True
+        self._HEADER.pack_into(self._shm.buf, 0, float("inf"), 0, 0, -1)
+    
+    def __getstate__(self):
+        # Sent to agent processes by name; they attach to the same block
+        return {
+            "name": self._shm.name,
+            "route_capacity": self._route_capacity,
+            "lock": self._lock,
+        }
+    
+    def __setstate__(self, state):
+        self._route_capacity = state["route_capacity"]
+        self._lock = state["lock"]
+        self._shm = SharedMemory(name=state["name"])
+        self._owner = False
+    
+    def _encode(self, route, agent_id):
+        """Packs route and agent_id into bytes (done outside the lock)"""
+        route_len = len(route) if route is not None else 0
+        if route_len > self._route_capacity:
+            raise ValueError(
+                f"[ERROR] Route of length {route_len} exceeds the g_best capacity ({self._route_capacity})"
+            )
+        route_bytes = struct.pack(f"{route_len}i", *route) if route_len else b""
+        agent_bytes = agent_id.encode("utf-8")[:self.AGENT_ID_SIZE] if agent_id is not None else b""
+        agent_len = len(agent_bytes) if agent_id is not None else -1
+        return route_len, route_bytes, agent_len, agent_bytes
+    
+    def _write(self, cost, route_len, route_bytes, agent_len, agent_bytes):
+        """Copies an encoded g_best into the buffer (caller holds the lock)"""
+        buf = self._shm.buf
+        version = self.get_version() + 1
+        
+        self._HEADER.pack_into(buf, 0, cost, version, route_len, agent_len)
+        buf[self._HEADER.size:self._HEADER.size + len(agent_bytes)] = agent_bytes
+        buf[self._ROUTE_OFFSET:self._ROUTE_OFFSET + len(route_bytes)] = route_bytes
+    
+    def try_update(self, candidate_route, candidate_cost, agent_id):
+        """Tries to update the g_best if the candidate is better"""
+        # Unlocked pre-check: the cost only decreases (until reset), so a
+        # candidate that is not better now cannot become better
+        if candidate_cost >= self.get_cost():
+            return False
+        encoded = self._encode(candidate_route, agent_id)
+        with self._lock:
+            if candidate_cost < self.get_cost():
+                self._write(candidate_cost, *encoded)
+                return True
+        return False
+    
+    def get(self):
+        """Returns a copy of the current g_best as (route, cost, agent_id)"""
+        buf = self._shm.buf
+        with self._lock:
+            cost, _, route_len, agent_len = self._HEADER.unpack_from(buf, 0)
+            route = list(struct.unpack_from(f"{route_len}i", buf, self._ROUTE_OFFSET)) if route_len else None
+            agent_id = (
+                bytes(buf[self._HEADER.size:self._HEADER.size + agent_len]).decode("utf-8")
+                if agent_len >= 0 else None
+            )
+        return route, cost, agent_id
+    
+    def get_cost(self) -> float:
+        """
+        Returns the current g_best cost without taking the lock (a single
+        aligned 8-byte read), for read-only polling such as logging
+        """
+        return struct.unpack_from("d", self._shm.buf, 0)[0]
+    
+    def get_version(self) -> int:
+        """
+        Returns the change counter of the g_best without taking the lock
+        (a single aligned 8-byte read); it increases on every update or reset
+        """
+        return struct.unpack_from("q", self._shm.buf, 8)[0]
+    
+    def reset(self):
+        """Resets the g_best"""
+        encoded = self._encode(None, None)
+        with self._lock:
+            self._write(float("inf"), *encoded)
+    
+    def close(self):
+        """Detaches from the shared block; the owner also frees it"""
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
 # Singleton for single-agent use
-# For multi-agent, it will be replaced by an instance with a manager
+# For multi-agent, it is replaced in each agent process by a SharedGlobalBest
 global_best = GlobalBest()
@@ -0,0 +1,89 @@
+"""
+Reference implementations of the VND moves, one move at a time.
+The fused scans of src/actions/vnd/vnd.py are checked against these in the
+tests; production code does not use them.
+"""
+from typing import Iterator, List, Tuple
+
+
+def swap_neighborhood(route: List[int]) -> Iterator[Tuple[int, int]]:
+    """
+    Yields the (i, j) positions, i < j, of every swap move of the route
+    (the depot at both ends stays fixed); see swap_delta and apply_swap.
+    """
+    n = len(route)
+    for i in range(1, n - 1):
+        for j in range(i + 1, n - 1):
+            yield i, j
+
+
+def two_opt_neighborhood(route: List[int]) -> Iterator[Tuple[int, int]]:
+    """
+    Yields the (i, j) positions, i < j, of every 2-opt move of the route;
+    the move reverses the segment route[i..j]; see two_opt_delta and apply_two_opt.
+    """
+    n = len(route)
+    for i in range(1, n - 1):
+        for j in range(i + 1, n - 1):
+            yield i, j
+
+
+def two_opt_delta(
+    route: List[int],
+    i: int,
+    j: int,
+    trip_time_matrix: List[List[int]],
+    gains: List[int]
+) -> int:
+    """
+    Cost change of reversing route[i..j]: two boundary edges are replaced and
+    the inner edges change direction
+    """
+    a, b, c, e = route[i - 1], route[i], route[j], route[j + 1]
+    return (
+        trip_time_matrix[a][c] + trip_time_matrix[b][e] -
+        trip_time_matrix[a][b] - trip_time_matrix[c][e] +
+        gains[j] - gains[i]
+    )
+
+
+def is_feasible_swap(
+    route: List[int],
+    loads: List[int],
+    i: int,
+    j: int,
+    load_deltas: List[int],
+    max_capacity: int
+) -> bool:
+    """
+    Checks the capacity constraint after swapping positions i < j of a feasible
+    route, given its prefix loads. Only the loads at positions i..j-1 change.
+    """
+    shift = load_deltas[route[j]] - load_deltas[route[i]]
+    if shift == 0:
+        return True
+    for p in range(i, j):
+        load = loads[p] + shift
+        if load < 0 or load > max_capacity:
+            return False
+    return True
+
+
+def is_feasible_reversal(
+    loads: List[int],
+    i: int,
+    j: int,
+    max_capacity: int
+) -> bool:
+    """
+    Checks the capacity constraint after reversing route[i..j] of a feasible
+    route, given its prefix loads. The reversed segment is visited backwards,
+    so the new load at each of its positions is loads[i-1] + loads[j] - loads[q]
+    for q in i..j-1.
+    """
+    base = loads[i - 1] + loads[j]
+    for q in range(i, j):
+        load = base - loads[q]
+        if load < 0 or load > max_capacity:
+            return False
+    return True
@@ -0,0 +1,41 @@
+from itertools import accumulate
+
+from src.agent_beliefs import AgentBeliefs
+
+
+def reference_scores(beliefs, epsilon=1.0):
+    """Scores computed directly from the ActionStats, without any caching"""
+    return {
+        name: stats.success_rate * 10.0 + stats.times_success + stats.avg_improvement / 100.0 + epsilon
+        for name, stats in beliefs.actions.items()
+    }
+
+
+def test_scores_follow_updates():
+    beliefs = AgentBeliefs("agent_0", ["VND", "ILS", "VNS"])
+
+    assert beliefs.get_all_action_scores() == reference_scores(beliefs)
+    assert beliefs.get_best_action() == "VND"  # all tied, first registered wins
+
+    updates = [
+        ("ILS", 1000.0, 900.0),
+        ("VND", 900.0, 900.0),
+        ("VNS", 900.0, 850.0),
+        ("VNS", 850.0, 860.0),
+        ("ILS", 850.0, 700.0),
+    ]
+    for action, old_cost, new_cost in updates:
+        beliefs.update_after_action(action, old_cost, new_cost)
+
+        for epsilon in (1.0, 0.0, 1.0):
+            assert beliefs.get_all_action_scores(epsilon) == reference_scores(beliefs, epsilon)
+
+        expected = reference_scores(beliefs)
+        assert beliefs.get_best_action() == max(expected, key=expected.get)
+
+        names, weights, max_weight = beliefs.get_action_weights()
+        assert dict(zip(names, weights)) == expected
+        assert max_weight == max(expected.values())
+
+        names, cumulative = beliefs.get_cumulative_action_weights()
+        assert cumulative == list(accumulate(weights))
@@ -0,0 +1,44 @@
+import multiprocessing as mp
+
+from src.shared.blackboard import GlobalBest, SharedGlobalBest
+
+
+def _publish(global_best, route, cost, agent_id):
+    global_best.try_update(route, cost, agent_id)
+
+
+def test_shared_global_best_matches_global_best():
+    shared = SharedGlobalBest(route_capacity=6)
+    local = GlobalBest()
+    try:
+        for g_best in (shared, local):
+            assert g_best.get() == (None, float("inf"), None)
+            assert g_best.try_update([0, 2, 1, 3, 4, 0], 40, "agent_0")
+            assert not g_best.try_update([0, 4, 3, 2, 1, 0], 45, "agent_1")
+            assert g_best.try_update([0, 1, 2, 3, 4, 0], 32, "agent_1")
+        assert shared.get() == local.get() == ([0, 1, 2, 3, 4, 0], 32, "agent_1")
+        assert shared.get_cost() == local.get_cost() == 32
+        assert shared.get_version() == 2
+
+        shared.reset()
+        assert shared.get() == (None, float("inf"), None)
+        assert shared.get_version() == 3
+    finally:
+        shared.close()
+
+
+def test_shared_global_best_across_processes():
+    ctx = mp.get_context("spawn")
+    shared = SharedGlobalBest(route_capacity=6, lock=ctx.Lock())
+    try:
+        p = ctx.Process(target=_publish, args=(shared, [0, 1, 2, 3, 4, 0], 32, "agent_3"))
+        p.start()
+        p.join()
+        assert shared.get() == ([0, 1, 2, 3, 4, 0], 32, "agent_3")
+    finally:
+        shared.close()
+
+
+if __name__ == "__main__":
+    test_shared_global_best_matches_global_best()
+    test_shared_global_best_across_processes()
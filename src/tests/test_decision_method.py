@@ -0,0 +1,28 @@
+import random
+
+from itertools import accumulate
+
+from src.methods.decision_method import roulette_wheel_selection, cumulative_roulette_selection
+
+
+def test_roulette_selection_is_proportional_to_weights():
+    actions = ("VND", "ILS", "VNS")
+    weights = [1.0, 3.0, 6.0]
+
+    selections = [
+        lambda: roulette_wheel_selection(actions, weights, max(weights)),
+        lambda: cumulative_roulette_selection(actions, list(accumulate(weights))),
+    ]
+    for select in selections:
+        random.seed(0)
+        draws = 20000
+        counts = {action: 0 for action in actions}
+        for _ in range(draws):
+            counts[select()] += 1
+
+        for action, weight in zip(actions, weights):
+            assert abs(counts[action] / draws - weight / sum(weights)) < 0.02
+
+    # All weights zero: uniform choice
+    assert roulette_wheel_selection(actions, [0.0, 0.0, 0.0], 0.0) in actions
+    assert cumulative_roulette_selection(actions, [0.0, 0.0, 0.0]) in actions
@@ -0,0 +1,18 @@
+from src.utils.env_flags import env_flag
+
+
+def test_env_flag_parsing(monkeypatch):
+    monkeypatch.delenv("VRP_TEST_FLAG", raising=False)
+    assert env_flag("VRP_TEST_FLAG") is False
+    assert env_flag("VRP_TEST_FLAG", default=True) is True
+
+    for value in ("0", "false", "False", "no", "OFF", " 0 "):
+        monkeypatch.setenv("VRP_TEST_FLAG", value)
+        assert env_flag("VRP_TEST_FLAG", default=True) is False
+
+    for value in ("1", "true", "yes", "on"):
+        monkeypatch.setenv("VRP_TEST_FLAG", value)
+        assert env_flag("VRP_TEST_FLAG") is True
+
+    monkeypatch.setenv("VRP_TEST_FLAG", "")
+    assert env_flag("VRP_TEST_FLAG", default=True) is True
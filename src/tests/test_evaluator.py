@@ -0,0 +1,35 @@
+import random
+
+from src.utils.evaluator import evaluate_route
+from src.utils.feasibility import is_feasible_route
+from src.utils.load_instance import load_instance
+from src.utils.generate_random_feasible_route import generate_random_feasible_route
+
+
+def route_with_unknown_node(route, instance, node):
+    """Replaces the last active node of the instance in route by node"""
+    last = len(instance["load_deltas"]) - 1
+    bad = route.copy()
+    bad[bad.index(last)] = node
+    return bad
+
+
+def test_evaluate_route_rejects_unknown_node_ids():
+    instance = load_instance("instances/20.json")
+    random.seed(1)
+    route = generate_random_feasible_route(instance)
+    assert evaluate_route(route, instance)[0]
+
+    # -1 must not alias the last node
+    for node in (-1, -len(route), len(instance["load_deltas"])):
+        assert evaluate_route(route_with_unknown_node(route, instance, node), instance) == (False, float("inf"))
+
+
+def test_is_feasible_route_rejects_unknown_node_ids():
+    instance = load_instance("instances/20.json")
+    random.seed(1)
+    route = generate_random_feasible_route(instance)
+    assert is_feasible_route(route, instance)
+
+    for node in (-1, -len(route), len(instance["load_deltas"])):
+        assert not is_feasible_route(route_with_unknown_node(route, instance, node), instance)
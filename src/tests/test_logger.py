@@ -0,0 +1,154 @@
+import queue
+import threading
+
+from src.utils.logger import AgentLogger, get_logger, set_instance_name
+from src.utils import logger as logger_module
+
+
+def test_agent_logger_writes_all_messages_in_order(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = AgentLogger("agent_0", "1", "mahm", 1)
+
+    messages = [f"message {i} " + "x" * (i % 50) for i in range(5000)]
+    for message in messages[:100]:
+        logger.log(message)
+    logger.flush()
+    # Enough text to cross the flush threshold several times
+    for message in messages[100:]:
+        logger.log(message)
+    logger.close()
+
+    with open(tmp_path / "logs/1/mahm/1/agent_0.log", encoding="utf-8") as f:
+        assert f.read().splitlines() == messages
+
+
+def test_disabled_agent_logger_writes_nothing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = AgentLogger("agent_0", "1", "mahm", 1)
+    logger.enabled = False
+
+    assert not logger.is_enabled()
+    logger.log("message")
+    logger.log_iteration(0, "message")
+    logger.log_phase("phase", "message")
+    logger.log_state(1.0, 1.0, 1.0, "agent_0")
+    logger.close()
+
+    assert not (tmp_path / "logs/1/mahm/1/agent_0.log").exists()
+
+
+def test_get_logger_reuses_logger_per_key(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    set_instance_name("1", "mahm", 1)
+
+    logger = get_logger("agent_0")
+    assert get_logger("agent_0") is logger
+    assert get_logger("agent_0", "1", "mahm", 1) is logger
+    assert get_logger("agent_1") is not logger
+    assert get_logger("agent_0", run_number=2) is not logger
+
+    set_instance_name("1", "mahm", 1)
+    assert get_logger("agent_0") is not logger
+
+
+def test_deferred_records_match_formatted_messages(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = AgentLogger("agent_0", "1", "mahm", 1)
+
+    logger.log_iteration(3, "message")
+    logger.log_state(205, 200.5)
+    logger.log("plain")
+    logger.log_state(205, 200.5, 190.0, "agent_1")
+    logger.log_state(205, 200.5, float("inf"), None)
+    logger.log_state("N/A", 200.5)
+    logger.close()
+
+    with open(tmp_path / "logs/1/mahm/1/agent_0.log", encoding="utf-8") as f:
+        assert f.read().splitlines() == [
+            "Iteration 3: message",
+            "Current Cost: 205, p_best: 200.5",
+            "plain",
+            "Current Cost: 205, p_best: 200.5, g_best: 190 (agent agent_1)",
+            "Current Cost: 205, p_best: 200.5, g_best: inf (agent None)",
+            "Current Cost: N/A, p_best: 200.5",
+        ]
+
+
+def test_non_str_messages_are_logged_as_text(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = AgentLogger("agent_0", "1", "mahm", 1)
+
+    logger.log(42)
+    logger.log(None)
+    logger.log(("a", (1, 2)))
+    logger.log([0, 3, 0])
+    logger.close()
+
+    with open(tmp_path / "logs/1/mahm/1/agent_0.log", encoding="utf-8") as f:
+        assert f.read().splitlines() == ["42", "None", "('a', (1, 2))", "[0, 3, 0]"]
+
+
+def test_agent_logger_has_no_instance_dict(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = AgentLogger("agent_0")
+
+    assert not hasattr(logger, "__dict__")
+
+
+def test_get_logger_returns_null_logger_when_disabled(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(logger_module, "LOG_ENABLED", False)
+    set_instance_name("1", "mahm", 1)
+
+    logger = get_logger("agent_0")
+    assert get_logger("agent_1") is logger
+    assert not logger.is_enabled()
+    logger.log("message")
+    logger.log_state(1.0, 1.0, 1.0, "agent_0")
+    logger.close()
+
+    assert not (tmp_path / "logs").exists()
+
+
+def test_logging_enabled_parses_env_flags(monkeypatch):
+    monkeypatch.delenv("VRP_LOG_ENABLED", raising=False)
+    monkeypatch.delenv("VRP_LOGS_DISABLED", raising=False)
+    assert logger_module.logging_enabled()
+
+    for value in ("0", "false", "no"):
+        monkeypatch.setenv("VRP_LOGS_DISABLED", value)
+        assert logger_module.logging_enabled()
+    monkeypatch.setenv("VRP_LOGS_DISABLED", "1")
+    assert not logger_module.logging_enabled()
+
+    monkeypatch.delenv("VRP_LOGS_DISABLED")
+    monkeypatch.setenv("VRP_LOG_ENABLED", "false")
+    assert not logger_module.logging_enabled()
+
+
+def test_close_returns_when_writer_thread_is_gone(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dead_writer = threading.Thread(target=lambda: None)
+    dead_writer.start()
+    dead_writer.join()
+    monkeypatch.setattr(logger_module, "_writer", dead_writer)
+    monkeypatch.setattr(logger_module, "_write_queue", queue.SimpleQueue())
+    monkeypatch.setattr(logger_module, "_WRITER_POLL", 0.01)
+
+    logger = AgentLogger("agent_0", "1", "mahm", 1)
+    logger.log("message")
+    logger.close()  # must not block forever
+
+
+def test_bad_record_does_not_stop_the_writer(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    logger = AgentLogger("agent_0", "1", "mahm", 1)
+
+    logger._log_record("{:d}".format, ("not a number",))
+    logger.close()
+    assert "[ERROR]" in capsys.readouterr().err
+
+    logger.log("after")
+    logger.close()
+    with open(tmp_path / "logs/1/mahm/1/agent_0.log", encoding="utf-8") as f:
+        assert f.read() == "after\n"
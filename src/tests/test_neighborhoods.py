@@ -0,0 +1,189 @@
+import random
+
+import pytest
+
+from src.actions.vnd.neighborhoods.swap import swap_delta, apply_swap
+from src.actions.vnd.neighborhoods.two_opt import reversal_gains, apply_two_opt
+from src.actions.vnd.vnd import vnd, set_default_strategy as set_vnd_strategy, _best_swap_move, _best_two_opt_move
+from src.utils.compute_route_cost import compute_route_cost, set_agent_counters
+from src.utils.evaluation_counter import set_agent_context, clear_agent_context
+from src.utils.feasibility import is_feasible_route, node_load_deltas, prefix_loads
+from src.utils.load_instance import load_instance
+from src.utils.generate_random_feasible_route import generate_random_feasible_route
+from src.tests.reference_moves import (
+    swap_neighborhood, two_opt_neighborhood, two_opt_delta, is_feasible_swap, is_feasible_reversal
+)
+
+
+def test_swap_delta_matches_full_evaluation():
+    # 99.json has an asymmetric trip time matrix
+    for instance_path in ["instances/1.json", "instances/99.json", "instances/20.json"]:
+        instance = load_instance(instance_path)
+        matrix = instance["trip_time_matrix"]
+        load_deltas = node_load_deltas(instance)
+        max_capacity = instance["vehicle_fleet"]["max_capacity"]
+
+        random.seed(7)
+        route = generate_random_feasible_route(instance)
+        cost = compute_route_cost(route, matrix)
+        loads = prefix_loads(route, load_deltas)
+
+        for i, j in swap_neighborhood(route):
+            neighbor = route.copy()
+            apply_swap(neighbor, i, j)
+
+            assert cost + swap_delta(route, i, j, matrix) == compute_route_cost(neighbor, matrix)
+            assert is_feasible_swap(route, loads, i, j, load_deltas, max_capacity) == \
+                is_feasible_route(neighbor, instance)
+
+
+def test_two_opt_delta_matches_full_evaluation():
+    for instance_path in ["instances/1.json", "instances/99.json", "instances/20.json"]:
+        instance = load_instance(instance_path)
+        matrix = instance["trip_time_matrix"]
+        max_capacity = instance["vehicle_fleet"]["max_capacity"]
+
+        random.seed(7)
+        route = generate_random_feasible_route(instance)
+        cost = compute_route_cost(route, matrix)
+        loads = prefix_loads(route, node_load_deltas(instance))
+        gains = reversal_gains(route, matrix)
+
+        for i, j in two_opt_neighborhood(route):
+            neighbor = route.copy()
+            apply_two_opt(neighbor, i, j)
+
+            assert cost + two_opt_delta(route, i, j, matrix, gains) == compute_route_cost(neighbor, matrix)
+            assert is_feasible_reversal(loads, i, j, max_capacity) == is_feasible_route(neighbor, instance)
+
+
+def test_vnd_scans_pick_best_feasible_move():
+    for instance_path in ["instances/99.json", "instances/35.json", "instances/50.json"]:
+        instance = load_instance(instance_path)
+        matrix = instance["trip_time_matrix"]
+        load_deltas = node_load_deltas(instance)
+        max_capacity = instance["vehicle_fleet"]["max_capacity"]
+
+        random.seed(11)
+        route = generate_random_feasible_route(instance)
+        loads = prefix_loads(route, load_deltas)
+        gains = reversal_gains(route, matrix)
+
+        expected_swap = min(
+            [(swap_delta(route, i, j, matrix), i, j) for i, j in swap_neighborhood(route)
+             if is_feasible_swap(route, loads, i, j, load_deltas, max_capacity)] + [(0, -1, -1)],
+            key=lambda move: move[0]
+        )
+        expected_two_opt = min(
+            [(two_opt_delta(route, i, j, matrix, gains), i, j) for i, j in two_opt_neighborhood(route)
+             if is_feasible_reversal(loads, i, j, max_capacity)] + [(0, -1, -1)],
+            key=lambda move: move[0]
+        )
+
+        assert _best_swap_move(route, matrix, loads, load_deltas, max_capacity)[0] == expected_swap[0]
+        assert _best_two_opt_move(route, matrix, loads, gains, max_capacity)[0] == expected_two_opt[0]
+
+        # First-improvement: the first feasible improving move in scan order
+        first_swap = next(
+            ((swap_delta(route, i, j, matrix), i, j) for i, j in swap_neighborhood(route)
+             if swap_delta(route, i, j, matrix) < 0
+             and is_feasible_swap(route, loads, i, j, load_deltas, max_capacity)),
+            (0, -1, -1)
+        )
+        first_two_opt = next(
+            ((two_opt_delta(route, i, j, matrix, gains), i, j) for i, j in two_opt_neighborhood(route)
+             if two_opt_delta(route, i, j, matrix, gains) < 0
+             and is_feasible_reversal(loads, i, j, max_capacity)),
+            (0, -1, -1)
+        )
+
+        assert _best_swap_move(route, matrix, loads, load_deltas, max_capacity, first=True)[:3] == first_swap
+        assert _best_two_opt_move(route, matrix, loads, gains, max_capacity, first=True)[:3] == first_two_opt
+
+        # Only feasible moves count as evaluations (scanned up to the hit with first=True)
+        feasible_swaps = [
+            (i, j) for i, j in swap_neighborhood(route)
+            if is_feasible_swap(route, loads, i, j, load_deltas, max_capacity)
+        ]
+        assert _best_swap_move(route, matrix, loads, load_deltas, max_capacity)[3] == len(feasible_swaps)
+        assert _best_swap_move(route, matrix, loads, load_deltas, max_capacity, first=True)[3] == (
+            feasible_swaps.index(first_swap[1:]) + 1 if first_swap[1] >= 0 else len(feasible_swaps)
+        )
+        feasible_reversals = [
+            (i, j) for i, j in two_opt_neighborhood(route)
+            if is_feasible_reversal(loads, i, j, max_capacity)
+        ]
+        assert _best_two_opt_move(route, matrix, loads, gains, max_capacity)[3] == len(feasible_reversals)
+        assert _best_two_opt_move(route, matrix, loads, gains, max_capacity, first=True)[3] == (
+            feasible_reversals.index(first_two_opt[1:]) + 1 if first_two_opt[1] >= 0 else len(feasible_reversals)
+        )
+
+
+def reference_vnd_evaluations(route, instance, first):
+    """Evaluations of a full-route VND: each feasible neighbor scanned counts once"""
+    neighborhoods = [(swap_neighborhood, apply_swap), (two_opt_neighborhood, apply_two_opt)]
+    evaluations = 1  # initial route
+    current, current_cost = route, compute_route_cost(route, instance["trip_time_matrix"])
+    k = 0
+    while k < len(neighborhoods):
+        neighborhood, apply_move = neighborhoods[k]
+        best, best_cost = current, current_cost
+        for i, j in neighborhood(current):
+            neighbor = current.copy()
+            apply_move(neighbor, i, j)
+            if not is_feasible_route(neighbor, instance):
+                continue
+            evaluations += 1
+            cost = compute_route_cost(neighbor, instance["trip_time_matrix"])
+            if cost < best_cost:
+                best, best_cost = neighbor, cost
+                if first:
+                    break
+        if best_cost < current_cost:
+            current, current_cost, k = best, best_cost, 0
+        else:
+            k += 1
+    return evaluations
+
+
+def test_vnd_counts_only_feasible_neighbors():
+    counters = {}
+    set_agent_counters(counters)
+    set_agent_context("agent_0")
+    try:
+        for instance_path in ["instances/20.json", "instances/35.json"]:
+            instance = load_instance(instance_path)
+            random.seed(5)
+            route = generate_random_feasible_route(instance)
+
+            for strategy in ("best", "first"):
+                counters.clear()
+                vnd(route, instance, strategy=strategy)
+                assert counters["agent_0"] == reference_vnd_evaluations(route, instance, strategy == "first")
+    finally:
+        clear_agent_context()
+        set_agent_counters(None)
+
+
+
+def test_vnd_default_strategy_is_configurable():
+    instance = load_instance("instances/50.json")
+    random.seed(5)
+    route = generate_random_feasible_route(instance)
+
+    assert vnd(route, instance) == vnd(route, instance, strategy="best")
+    try:
+        set_vnd_strategy("first")
+        assert vnd(route, instance) == vnd(route, instance, strategy="first")
+    finally:
+        set_vnd_strategy("best")
+
+    with pytest.raises(ValueError):
+        set_vnd_strategy("worst")
+
+if __name__ == "__main__":
+    test_swap_delta_matches_full_evaluation()
+    test_two_opt_delta_matches_full_evaluation()
+    test_vnd_scans_pick_best_feasible_move()
+    test_vnd_counts_only_feasible_neighbors()
+    test_vnd_default_strategy_is_configurable()
@@ -1,8 +1,12 @@
+import random
+
 from src.utils.load_instance import load_instance
 from src.utils.generate_random_feasible_route import generate_random_feasible_route
 from src.utils.evaluator import evaluate_route
 from src.methods.path_relinking import path_relinking
 from src.actions.vnd.vnd import vnd
+from src.utils.compute_route_cost import set_agent_counters
+from src.utils.evaluation_counter import set_agent_context, clear_agent_context
 
 
 def verbose_intensification(route, instance):
@@ -61,5 +65,62 @@ def main():
     print("Viável:", feasible)
 
 
+def reference_path_relinking(origin, target, instance):
+    """
+    Path-relinking evaluating every route on the path in full, with an
+    intensification that is always rejected: returns the best route along
+    the path, its cost and the number of evaluations made
+    """
+    current = origin.copy()
+    origin_cost = evaluate_route(origin, instance)[1]
+    evaluations = 1
+    best_route, best_cost = origin.copy(), origin_cost
+
+    for i in range(1, len(origin) - 1):
+        if current[i] == target[i]:
+            continue
+        j = current.index(target[i])
+        current[i], current[j] = current[j], current[i]
+
+        feasible, cost = evaluate_route(current, instance)
+        if not feasible:
+            continue
+        evaluations += 1
+        if cost < best_cost:
+            best_route, best_cost = current.copy(), cost
+        if cost < origin_cost:
+            break
+
+    return best_route, best_cost, evaluations
+
+
+def test_path_relinking_cost_matches_full_evaluation():
+    # The intensified route is rejected (infeasible), so path_relinking returns
+    # its own incrementally evaluated best route and cost
+    def rejected_intensification(route, instance):
+        return [0, 0], 0
+
+    counters = {}
+    set_agent_counters(counters)
+    set_agent_context("agent_0")
+    try:
+        for instance_path in ["instances/1.json", "instances/20.json", "instances/50.json"]:
+            instance = load_instance(instance_path)
+            random.seed(3)
+            for _ in range(20):
+                origin = generate_random_feasible_route(instance)
+                target = generate_random_feasible_route(instance)
+
+                counters.clear()
+                route, cost = path_relinking(origin, target, instance, rejected_intensification)
+                evaluations = counters.get("agent_0", 0)
+
+                assert evaluate_route(route, instance) == (True, cost)
+                assert (route, cost, evaluations) == reference_path_relinking(origin, target, instance)
+    finally:
+        clear_agent_context()
+        set_agent_counters(None)
+
+
 if __name__ == "__main__":
     main()
@@ -1,20 +1,36 @@
-# Module-level variable to store the shared agent_counters dictionary
+from itertools import islice
+
+from src.utils.evaluation_counter import increment_evaluation
+
+# Module-level variable to store the agent_counters dictionary
 # This is set by each agent process and accessed during evaluation counting
 _agent_counters: dict = None
 
 
 def set_agent_counters(agent_counters: dict) -> None:
     """
-    Set the shared agent_counters dictionary for this process.
-    Called by each agent process to provide access to the shared counter.
+    Set the agent_counters dictionary for this process.
+    Called by each agent process to provide access to its counter.
     
     Args:
-        agent_counters: Shared dictionary mapping agent_id to evaluation count
+        agent_counters: Dictionary mapping agent_id to evaluation count
     """
     global _agent_counters
     _agent_counters = agent_counters
 
 
+def count_evaluations(count: int) -> None:
+    """
+    Count objective function evaluations made without compute_route_cost,
+    e.g. neighbors whose cost is obtained by delta evaluation.
+    
+    Args:
+        count: Number of evaluations to add for the current agent
+    """
+    if _agent_counters is not None and count > 0:
+        increment_evaluation(_agent_counters, count)
+
+
 def compute_route_cost(route: list[int], trip_time_matrix: list[list[int]]) -> int:
     """
     Compute the cost of a route and count this as an objective function evaluation.
@@ -28,12 +44,12 @@ def compute_route_cost(route: list[int], trip_time_matrix: list[list[int]]) -> i
     """
     # Increment evaluation counter if agent_counters is available
     if _agent_counters is not None:
-        from src.utils.evaluation_counter import increment_evaluation
         increment_evaluation(_agent_counters)
     
+    # Walk the route once, keeping the matrix row of the current origin
     cost = 0
-    for i in range(len(route) - 1):
-        origin = route[i]
-        destination = route[i + 1]
-        cost += trip_time_matrix[origin][destination]
+    row = trip_time_matrix[route[0]]
+    for destination in islice(route, 1, None):
+        cost += row[destination]
+        row = trip_time_matrix[destination]
     return cost
@@ -0,0 +1,15 @@
+import os
+
+# Values of a boolean environment variable that turn it off (case-insensitive)
+FALSE_VALUES = ("0", "false", "no", "off")
+
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """
+    Reads a boolean environment variable: unset or empty gives default,
+    0/false/no/off gives False and any other value gives True
+    """
+    value = os.environ.get(name, "").strip().lower()
+    if not value:
+        return default
+    return value not in FALSE_VALUES
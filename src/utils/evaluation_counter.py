@@ -40,7 +40,7 @@ def get_agent_context() -> Optional[str]:
     return getattr(_local_context, 'agent_id', None)
 
 
-def increment_evaluation(agent_counters: Dict[str, int]) -> None:
+def increment_evaluation(agent_counters: Dict[str, int], count: int = 1) -> None:
     """
     Increment the evaluation counter for the current agent.
     
@@ -48,15 +48,13 @@ def increment_evaluation(agent_counters: Dict[str, int]) -> None:
     each objective function evaluation.
     
     Args:
-        agent_counters: Shared dictionary mapping agent_id to evaluation count
+        agent_counters: Dictionary mapping agent_id to evaluation count (local to the
+                        agent's process; see init_agent_process in run.py)
+        count: Number of evaluations to add (default 1)
     """
-    agent_id = get_agent_context()
+    agent_id = getattr(_local_context, 'agent_id', None)
     if agent_id is not None:
-        # Initialize counter if it doesn't exist
-        if agent_id not in agent_counters:
-            agent_counters[agent_id] = 0
-        # Increment the counter
-        agent_counters[agent_id] = agent_counters[agent_id] + 1
+        agent_counters[agent_id] = agent_counters.get(agent_id, 0) + count
 
 
 def get_agent_evaluation_count(agent_id: str, agent_counters: Dict[str, int]) -> int:
@@ -1,16 +1,51 @@
-from src.utils.feasibility import is_feasible_route
-from src.utils.compute_route_cost import compute_route_cost
+from itertools import islice
+
+from src.utils.compute_route_cost import count_evaluations
 
 
 def evaluate_route(route: list[int], instance: dict) -> tuple[bool, float]:
     """
     Returns (feasible, cost).
     If infeasible, cost = infinity.
+
+    Feasibility (same rules as is_feasible_route) and cost (same as
+    compute_route_cost) are computed in a single pass over the route; only a
+    feasible route counts as an objective function evaluation.
     """
-    feasible = is_feasible_route(route, instance)
+    load_deltas = instance["load_deltas"]
+    n_nodes = len(load_deltas)
 
-    if not feasible:
+    # Starts and ends at the depot, with room for each active node exactly once
+    if route[0] != 0 or route[-1] != 0 or len(route) != n_nodes + 1:
         return False, float("inf")
 
-    cost = compute_route_cost(route, instance["trip_time_matrix"])
+    trip_time_matrix = instance["trip_time_matrix"]
+    max_capacity = instance["max_capacity"]
+
+    visited = bytearray(n_nodes)
+    visited[0] = 1  # the depot may not appear inside the route
+    load = 0
+    cost = 0
+    row = trip_time_matrix[0]
+
+    for v in islice(route, 1, len(route) - 1):
+        # Unknown node id (checked explicitly: a negative id would index from the end)
+        if not 0 < v < n_nodes:
+            return False, float("inf")
+
+        # Visits each active node only once
+        if visited[v]:
+            return False, float("inf")
+        visited[v] = 1
+
+        # Capacity constraint
+        load += load_deltas[v]
+        if load < 0 or load > max_capacity:
+            return False, float("inf")
+
+        cost += row[v]
+        row = trip_time_matrix[v]
+
+    cost += row[0]
+    count_evaluations(1)
     return True, cost
@@ -1,3 +1,6 @@
+from itertools import islice
+
+
 def is_feasible_route(route: list[int], instance: dict) -> bool:
     """
     Checks if the route respects:
@@ -6,29 +9,57 @@ def is_feasible_route(route: list[int], instance: dict) -> bool:
     - dynamic capacity constraint
     """
 
-    nodes = instance["nodes"]
-    max_capacity = instance["vehicle_fleet"]["max_capacity"]
+    load_deltas = instance["load_deltas"]
+    max_capacity = instance["max_capacity"]
+    n_nodes = len(load_deltas)
 
     # 1. Starts and ends at the depot
     if route[0] != 0 or route[-1] != 0:
         return False
 
-    # 2. Visits each active node only once
-    active_nodes = {n["id"] for n in nodes if n["id"] != 0}
-    route_nodes = route[1:-1]
-
-    if set(route_nodes) != active_nodes:
+    # 2. Visits each active node only once: n_nodes - 1 inner positions,
+    # none repeated (the depot is marked up front so it cannot appear inside)
+    if len(route) != n_nodes + 1:
         return False
 
-    # 3. Capacity constraint
+    visited = bytearray(n_nodes)
+    visited[0] = 1
     load = 0
-    node_map = {n["id"]: n for n in nodes}
 
-    for v in route_nodes:
-        node = node_map[v]
-        load += node["n_boardings"] - node["n_alighting"]
+    for v in islice(route, 1, len(route) - 1):
+        # Unknown node id (checked explicitly: a negative id would index from the end)
+        if not 0 < v < n_nodes:
+            return False
+        if visited[v]:
+            return False
+        visited[v] = 1
 
+        # 3. Capacity constraint
+        load += load_deltas[v]
         if load < 0 or load > max_capacity:
             return False
 
     return True
+
+
+def node_load_deltas(instance: dict) -> list[int]:
+    """
+    Returns the load change (boardings - alightings) of each node, indexed by node id
+    """
+    nodes = instance["nodes"]
+    deltas = [0] * (max(n["id"] for n in nodes) + 1)
+    for n in nodes:
+        deltas[n["id"]] = n["n_boardings"] - n["n_alighting"]
+    return deltas
+
+
+def prefix_loads(route: list[int], load_deltas: list[int]) -> list[int]:
+    """
+    Returns the vehicle load after each position of the route (0 at the start depot)
+    """
+    loads = [0] * len(route)
+    load = 0
+    for p in range(1, len(route)):
+        load += load_deltas[route[p]]
+        loads[p] = load
+    return loads
@@ -2,50 +2,60 @@ import random
 import math
 
 def generate_random_feasible_route(instance: dict) -> list[int]:
-    nodes = instance["nodes"]
-    trip_time = instance["trip_time_matrix"]
-    max_capacity = instance["vehicle_fleet"]["max_capacity"]
+    load_deltas = instance["load_deltas"]
+    nearest_nodes = instance["nearest_nodes"]
+    max_capacity = instance["max_capacity"]
 
     # Active nodes (excluding the depot 0)
-    active_nodes = [n["id"] for n in nodes if n["id"] != 0]
+    active_nodes = instance["active_nodes"]
 
     route = [0]  # starts at the depot
     pending = active_nodes.copy()
+    visited = bytearray(len(load_deltas))
+    visited[0] = 1
     current_load = 0
 
     while pending:
-        candidates = []
-
+        # Number of feasible candidates (pending nodes that keep the load valid)
+        n_candidates = 0
         for v in pending:
-            node = next(n for n in nodes if n["id"] == v)
-            new_load = current_load + node["n_boardings"] - node["n_alighting"]
+            new_load = current_load + load_deltas[v]
 
             if 0 <= new_load <= max_capacity:
-                candidates.append((v, new_load))
+                n_candidates += 1
 
-        if not candidates:
+        if not n_candidates:
             raise RuntimeError(
                 "It was not possible to generate a feasible route (empty candidate)."
             )
 
         # ---------------------------------------------------------
         # GRASP-like candidate ordering
-        # Sort candidates by travel time from the current node
+        # Candidates by travel time from the current node, taken from
+        # the precomputed nearest_nodes order (no sort per step);
+        # only the k% best are collected
         # ---------------------------------------------------------
-        current_node = route[-1]
-        candidates.sort(
-            key=lambda x: trip_time[current_node][x[0]]
-        )
+        k_percent = 0.05  # 5% as used in the MAHM paper
+        k = max(1, math.ceil(k_percent * n_candidates))
+
+        best_candidates = []
+        for v in nearest_nodes[route[-1]]:
+            if visited[v]:
+                continue
+            new_load = current_load + load_deltas[v]
+            if 0 <= new_load <= max_capacity:
+                best_candidates.append((v, new_load))
+                if len(best_candidates) == k:
+                    break
 
         # ---------------------------------------------------------
         # Select randomly among the k% best candidates
         # ---------------------------------------------------------
-        k_percent = 0.05  # 5% as used in the MAHM paper
-        k = max(1, math.ceil(k_percent * len(candidates)))
-        chosen, new_load = random.choice(candidates[:k])
+        chosen, new_load = random.choice(best_candidates)
 
         route.append(chosen)
         pending.remove(chosen)
+        visited[chosen] = 1
         current_load = new_load
 
     route.append(0)  # closes the cycle
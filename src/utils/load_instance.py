@@ -1,5 +1,20 @@
 import json
 
+from src.utils.feasibility import node_load_deltas
+
 def load_instance(instance_path: str) -> dict:
     with open(instance_path, "r") as f:
-        return json.load(f)
+        instance = json.load(f)
+
+    # Derived data read by the hot paths, computed once per instance:
+    # load change (boardings - alightings) of each node, indexed by node id
+    instance["load_deltas"] = node_load_deltas(instance)
+    # ids of the nodes to visit (all but the depot)
+    instance["active_nodes"] = [n["id"] for n in instance["nodes"] if n["id"] != 0]
+    # vehicle capacity, without the nested vehicle_fleet lookup
+    instance["max_capacity"] = instance["vehicle_fleet"]["max_capacity"]
+    # for each node, all node ids by increasing travel time from it (ties by id)
+    instance["nearest_nodes"] = [
+        sorted(range(len(row)), key=row.__getitem__) for row in instance["trip_time_matrix"]
+    ]
+    return instance
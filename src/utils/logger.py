@@ -1,45 +1,287 @@
+import atexit
 import os
-from typing import Optional
+import queue
+import sys
+import threading
+from typing import Callable, Optional
+
+from src.utils.env_flags import env_flag
+
+
+def logging_enabled() -> bool:
+    """
+    Agent logging can be turned off with VRP_LOG_ENABLED=0 or VRP_LOGS_DISABLED=1
+    (e.g. for timing runs); get_logger then hands out a logger that does nothing
+    """
+    return env_flag("VRP_LOG_ENABLED", True) and not env_flag("VRP_LOGS_DISABLED")
+
+
+LOG_ENABLED = logging_enabled()
+
+# Buffered log entries waiting to be written by the writer thread:
+# (log_file, entries) to append, (log_file, None) to close the file, or a
+# threading.Event to set once everything queued before it is on disk
+_write_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+_writer: Optional[threading.Thread] = None
+# Log directories already created by this process
+_created_dirs: set[str] = set()
+# Items taken from the queue per wake-up of the writer thread
+_WRITER_BATCH = 1024
+# Seconds between checks that the writer thread is still alive while waiting on it
+_WRITER_POLL = 0.5
+# Log files are opened for appending only, without a Python file object.
+# With O_APPEND the kernel moves to the end of the file atomically on every
+# write, so no lock is needed: within a process only the writer thread writes,
+# and a file shared by several processes (e.g. a rerun appending to the same
+# path) only ever sees whole writes appended, never overwritten.
+_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+
+
+def _open_log_file(log_file: str) -> int:
+    """Opens a log file for appending, creating its directory if it has gone missing"""
+    try:
+        return os.open(log_file, _OPEN_FLAGS, 0o644)
+    except FileNotFoundError:
+        # Directory created by an earlier logger but since removed (or
+        # created relative to another working directory)
+        directory = os.path.dirname(log_file)
+        os.makedirs(directory, exist_ok=True)
+        _created_dirs.add(directory)
+        return os.open(log_file, _OPEN_FLAGS, 0o644)
+
+
+def _write_all(fd: int, chunks: list[bytes]):
+    """Appends the chunks with a single gather write (repeated if the write is short)"""
+    total = sum(map(len, chunks))
+    written = os.writev(fd, chunks) if len(chunks) > 1 else os.write(fd, chunks[0])
+    if written < total:
+        rest = b"".join(chunks)[written:]
+        while rest:
+            rest = rest[os.write(fd, rest):]
+
+
+def _format_cost(cost) -> str:
+    """
+    Costs are sums of integer trip times: ".10g" prints them without a
+    trailing ".0" or float noise, exactly up to 10 digits. Anything that is
+    not a number is logged as is.
+    """
+    if type(cost) is int or type(cost) is float:
+        return format(cost, ".10g")
+    return str(cost)
+
+
+def _format_state(current_cost, p_best_cost, g_best_cost, g_best_agent) -> str:
+    """Log line of AgentLogger.log_state"""
+    state_msg = f"Current Cost: {_format_cost(current_cost)}, p_best: {_format_cost(p_best_cost)}"
+    if g_best_cost is None:
+        return state_msg
+    return f"{state_msg}, g_best: {_format_cost(g_best_cost)} (agent {g_best_agent})"
+
+
+class _Record(tuple):
+    """(render, args) log entry whose formatting is deferred to the writer thread"""
+    __slots__ = ()
+
+
+def _render(entries: list) -> str:
+    """Log text of buffered entries: message strs and deferred _Record entries"""
+    lines = [
+        entry[0](*entry[1]) if entry.__class__ is _Record else entry
+        for entry in entries
+    ]
+    lines.append("")  # trailing newline
+    return "\n".join(lines)
+
+
+def _write_loop():
+    """Writer thread: appends the queued text to the log files"""
+    fds: dict[str, int] = {}
+    pending: dict[str, list[bytes]] = {}
+
+    def write_pending():
+        for log_file, chunks in pending.items():
+            try:
+                fd = fds.get(log_file)
+                if fd is None:
+                    fd = fds[log_file] = _open_log_file(log_file)
+                _write_all(fd, chunks)
+            except Exception as e:
+                print(f"[ERROR] Could not write log file {log_file}: {e!r}", file=sys.stderr)
+        pending.clear()
+
+    while True:
+        batch = [_write_queue.get()]
+        try:
+            while len(batch) < _WRITER_BATCH:
+                batch.append(_write_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        # Text for the same file is gathered and written with one writev.
+        # An error in one item (e.g. a record that fails to format) is
+        # reported and skipped: if this thread died, close() would find its
+        # messages unwritten
+        for item in batch:
+            if isinstance(item, threading.Event):
+                try:
+                    write_pending()
+                finally:
+                    item.set()
+                continue
+
+            log_file, entries = item
+            try:
+                if entries is None:
+                    write_pending()
+                    fd = fds.pop(log_file, None)
+                    if fd is not None:
+                        os.close(fd)
+                    continue
+                chunks = pending.get(log_file)
+                if chunks is None:
+                    chunks = pending[log_file] = []
+                chunks.append(_render(entries).encode("utf-8"))
+            except Exception as e:
+                print(f"[ERROR] Could not write log file {log_file}: {e!r}", file=sys.stderr)
+
+        write_pending()
+
+
+def _submit(item):
+    """Queues an item for the writer thread, starting it if needed"""
+    global _writer
+    if _writer is None:
+        _writer = threading.Thread(target=_write_loop, name="log-writer", daemon=True)
+        _writer.start()
+    _write_queue.put(item)
+
+
+def _wait_for_writer():
+    """Blocks until everything queued so far has been written"""
+    if _writer is None:
+        return
+    done = threading.Event()
+    _write_queue.put(done)
+    # The writer is a daemon thread: if it has died, nothing will ever set the event
+    while not done.wait(_WRITER_POLL):
+        if not _writer.is_alive():
+            print("[ERROR] Log writer thread is not running; buffered log messages were not written", file=sys.stderr)
+            return
+
+
+def _reset_writer():
+    """A forked child starts with no writer thread and an empty queue"""
+    global _write_queue, _writer
+    _write_queue = queue.SimpleQueue()
+    _writer = None
+
+
+os.register_at_fork(after_in_child=_reset_writer)
+
+
+def _log_dir(instance_name: Optional[str], action_name: Optional[str], run_number: Optional[int]) -> str:
+    """Directory of the agent logs of an instance, action, and run"""
+    if instance_name:
+        if action_name:
+            if run_number is not None:
+                return f"logs/{instance_name}/{action_name.lower()}/{run_number}"
+            return f"logs/{instance_name}/{action_name.lower()}"
+        return f"logs/{instance_name}"
+    return "logs"
+
+
+def _make_log_dir(log_dir: str):
+    """Creates a log directory, once per directory and process"""
+    if log_dir not in _created_dirs:
+        os.makedirs(log_dir, exist_ok=True)
+        _created_dirs.add(log_dir)
+
 
 class AgentLogger:
     """
     Simple logger for each agent that writes to file.
     Each agent has its own log file: logs/{instance_name}/{action_name}/{run_number}/{agent_id}.log
+    
+    Messages are kept in memory and only handed over on flush() (or once
+    FLUSH_THRESHOLD characters are buffered) to a background writer thread,
+    which keeps the file open and does the actual I/O, so the agent loop
+    never blocks on a write. close() waits until everything is on disk.
+    The numeric values of log_iteration/log_state are formatted by the writer
+    thread as well.
     """
     
+    __slots__ = ("agent_id", "log_dir", "log_file", "_buffer", "_buffered_chars", "enabled")
+    
+    FLUSH_THRESHOLD = 65536
+    # Characters counted towards FLUSH_THRESHOLD for a deferred record
+    RECORD_CHARS = 80
+    
     def __init__(self, agent_id: str, instance_name: Optional[str] = None, action_name: Optional[str] = None, run_number: Optional[int] = None):
         self.agent_id = agent_id
-        if instance_name:
-            if action_name:
-                if run_number is not None:
-                    self.log_dir = f"logs/{instance_name}/{action_name.lower()}/{run_number}"
-                else:
-                    self.log_dir = f"logs/{instance_name}/{action_name.lower()}"
-            else:
-                self.log_dir = f"logs/{instance_name}"
-        else:
-            self.log_dir = "logs"
+        self.log_dir = _log_dir(instance_name, action_name, run_number)
         self.log_file = f"{self.log_dir}/{agent_id}.log"
+        self._buffer: list = []
+        self._buffered_chars = 0
+        self.enabled = LOG_ENABLED
         
-        # Create log directory if it does not exist
-        os.makedirs(self.log_dir, exist_ok=True)
+        # Create log directory if it does not exist (usually already done by
+        # set_instance_name; all agents of a run share it)
+        _make_log_dir(self.log_dir)
         
         # Clear log file when initializing (optional - can be append)
         # Commented to keep history
         # if os.path.exists(self.log_file):
         #     open(self.log_file, 'w').close()
     
+    def is_enabled(self) -> bool:
+        """Whether messages are being logged; callers can check it to skip building them"""
+        return self.enabled
+    
     def log(self, message: str):
-        """Writes a message to the agent's log file"""
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            f.write(f"{message}\n")
+        """Adds a message to the agent's log (written to file on flush)"""
+        if not self.enabled:
+            return
+        if message.__class__ is not str:
+            message = str(message)
+        self._buffer.append(message)
+        self._buffered_chars += len(message) + 1
+        if self._buffered_chars >= self.FLUSH_THRESHOLD:
+            self.flush()
+    
+    def _log_record(self, render: Callable[..., str], args: tuple):
+        """Adds a message to be built as render(*args) by the writer thread"""
+        self._buffer.append(_Record((render, args)))
+        self._buffered_chars += self.RECORD_CHARS
+        if self._buffered_chars >= self.FLUSH_THRESHOLD:
+            self.flush()
+    
+    def flush(self):
+        """Hands all buffered messages to the writer thread"""
+        if not self._buffer:
+            return
+        # The list itself is handed over; the logger starts a new one
+        _submit((self.log_file, self._buffer))
+        self._buffer = []
+        self._buffered_chars = 0
+    
+    def close(self):
+        """Flushes the buffered messages and waits until the log file is written and closed"""
+        self.flush()
+        if _writer is not None:
+            _write_queue.put((self.log_file, None))
+            _wait_for_writer()
     
     def log_iteration(self, iteration: int, message: str):
         """Writes a message with iteration number"""
-        self.log(f"Iteration {iteration}: {message}")
+        if not self.enabled:
+            return
+        self._log_record("Iteration {}: {}".format, (iteration, message))
     
     def log_phase(self, phase: str, message: str = ""):
         """Writes a message of the cycle phase"""
+        if not self.enabled:
+            return
         if message:
             self.log(f"{phase}: {message}")
         else:
@@ -47,18 +289,57 @@ class AgentLogger:
     
     def log_state(self, current_cost: float, p_best_cost: float, g_best_cost: Optional[float] = None, g_best_agent: Optional[str] = None):
         """Writes the current state of the agent"""
-        state_msg = f"Current Cost: {current_cost}, p_best: {p_best_cost}"
-        if g_best_cost is not None:
-            state_msg += f", g_best: {g_best_cost} (agent {g_best_agent})"
-        self.log(state_msg)
+        if not self.enabled:
+            return
+        self._log_record(_format_state, (current_cost, p_best_cost, g_best_cost, g_best_agent))
+
+
+class _NullLogger:
+    """Logger handed out when logging is disabled: every method is a no-op"""
+    
+    __slots__ = ()
+    
+    enabled = False
+    
+    def is_enabled(self) -> bool:
+        return False
+    
+    def _noop(self, *args, **kwargs):
+        pass
+    
+    log = log_iteration = log_phase = log_state = flush = close = _noop
+
+
+_NULL_LOGGER = _NullLogger()
+
+
+class _LoggerRegistry(dict):
+    """Loggers keyed by (instance, action, run, agent_id), created on first lookup"""
+    
+    def __missing__(self, key: tuple) -> AgentLogger:
+        instance, action, run, agent_id = key
+        # setdefault is atomic: if another thread registered a logger for the
+        # same key meanwhile, that one is kept and returned
+        return self.setdefault(key, AgentLogger(agent_id, instance, action, run))
 
 
 # Singleton global - will be initialized by each agent
-_loggers: dict[str, AgentLogger] = {}
+_loggers: _LoggerRegistry = _LoggerRegistry()
 _current_instance: Optional[str] = None
 _current_action: Optional[str] = None
 _current_run: Optional[int] = None
 
+def close_loggers():
+    """Closes all loggers of this process (flushing their buffered messages)"""
+    for logger in _loggers.values():
+        logger.close()
+    _loggers.clear()
+
+
+# Loggers still open when the interpreter exits are flushed and closed
+atexit.register(close_loggers)
+
+
 def set_instance_name(instance_name: str, action_name: Optional[str] = None, run_number: Optional[int] = None):
     """Define the current instance name, action name, and run number for the logs"""
     global _current_instance, _current_action, _current_run, _loggers
@@ -66,11 +347,17 @@ def set_instance_name(instance_name: str, action_name: Optional[str] = None, run
     _current_action = action_name
     _current_run = run_number
     # Clear existing loggers when changing instance, action, or run
-    _loggers.clear()
+    # (writing out whatever they still have buffered)
+    close_loggers()
+    # Create the directory the loggers of this run will share up front,
+    # outside the agent loop
+    if LOG_ENABLED:
+        _make_log_dir(_log_dir(instance_name, action_name, run_number))
 
 def get_logger(agent_id: str, instance_name: Optional[str] = None, action_name: Optional[str] = None, run_number: Optional[int] = None) -> AgentLogger:
     """
-    Gets or creates a logger for the agent.
+    Gets or creates a logger for the agent
+    (a shared no-op logger if logging is disabled).
     
     Args:
         agent_id: Agent ID
@@ -79,22 +366,14 @@ def get_logger(agent_id: str, instance_name: Optional[str] = None, action_name:
         run_number: Run number (if None, uses _current_run)
     """
     global _current_instance, _current_action, _current_run
+    if not LOG_ENABLED:
+        return _NULL_LOGGER
     # Use the provided values or the global
     instance = instance_name if instance_name is not None else _current_instance
     action = action_name if action_name is not None else _current_action
     run = run_number if run_number is not None else _current_run
     
-    # Create a unique key combining instance, action, run, and agent_id
-    if instance and action and run is not None:
-        logger_key = f"{instance}_{action}_{run}_{agent_id}"
-    elif instance and action:
-        logger_key = f"{instance}_{action}_{agent_id}"
-    elif instance:
-        logger_key = f"{instance}_{agent_id}"
-    else:
-        logger_key = agent_id
-    
-    if logger_key not in _loggers:
-        _loggers[logger_key] = AgentLogger(agent_id, instance, action, run)
-    return _loggers[logger_key]
+    # Unique key combining instance, action, run, and agent_id
+    # (a missing logger is created by the registry)
+    return _loggers[(instance, action, run, agent_id)]
 
@@ -0,0 +1,13 @@
+import random
+from typing import Tuple
+
+
+def distinct_random_positions(m: int) -> Tuple[int, int]:
+    """
+    Draws two distinct uniform positions (i, j) of range(m), m >= 2, in random
+    order, without building a sample population
+    """
+    i = random.randrange(m)
+    j = random.randrange(m - 1)
+    j += j >= i
+    return i, j